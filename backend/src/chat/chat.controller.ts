@@ -1,4 +1,4 @@
-import { Controller, Post, Body, Get, Query, Delete, Param, Put, Res, HttpCode, HttpStatus } from '@nestjs/common';
+import { Controller, Post, Body, Get, Query, Delete, Param, Put, Res, HttpCode, HttpStatus, Logger } from '@nestjs/common';
 import { Observable } from 'rxjs';
 import type { Response } from 'express';
 import { ChatService } from './chat.service';
@@ -7,19 +7,21 @@ import { CreateSessionDto } from './dto/create-session.dto';
 import { SaveSummaryDto } from './dto/save-summary.dto';
 import { AddMessageDto } from './dto/add-message.dto';
 import { UpdateSessionTitleDto } from './dto/update-session-title.dto';
-import { ChatSession } from '../types/chat.types';
+import { ChatSessionListItem } from '../types/chat.types';
 import { ApiTags, ApiOperation, ApiResponse, ApiQuery, ApiParam } from '@nestjs/swagger';
 
 @ApiTags('chat')
 @Controller('chat')
 export class ChatController {
+  private readonly logger = new Logger(ChatController.name);
+
   constructor(private readonly chatService: ChatService) {}
 
   @Get('sessions')
   @ApiOperation({ summary: 'Get all chat sessions for a user' })
   @ApiQuery({ name: 'userAddress', required: true, description: 'The wallet address of the user' })
   @ApiResponse({ status: 200, description: 'Returns all chat sessions for the user' })
-  async getSessions(@Query('userAddress') userAddress: string): Promise<{ success: boolean, sessions: ChatSession[], message?: string }> {
+  async getSessions(@Query('userAddress') userAddress: string): Promise<{ success: boolean, sessions: ChatSessionListItem[], message?: string }> {
     return this.chatService.getSessions(userAddress);
   }
 
@@ -118,7 +120,7 @@ export class ChatController {
         response.write(`data: ${event.data}\n\n`);
       },
       error: (error) => {
-        console.error('Streaming error:', error);
+        this.logger.error(`Streaming error: ${error.message}`);
         response.write(`data: ${JSON.stringify({ type: 'error', message: error.message })}\n\n`);
         response.end();
       },
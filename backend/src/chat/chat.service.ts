@@ -1,4 +1,5 @@
 import { BadRequestException, Injectable, Logger, NotFoundException } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
 import { Observable, Subject } from 'rxjs';
 import { GeminiService } from '../infrastructure/gemini/gemini.service';
 import { SuiService } from '../infrastructure/sui/sui.service';
@@ -9,12 +10,14 @@ import { SummarizationService } from './summarization/summarization.service';
 import { MemoryQueryService } from '../memory/memory-query/memory-query.service';
 import { MemoryIngestionService } from '../memory/memory-ingestion/memory-ingestion.service';
 import { AddMessageDto } from './dto/add-message.dto';
-import { ChatMessage, ChatSession as ChatSessionType } from '../types/chat.types';
+import { ChatMessage, ChatSessionListItem } from '../types/chat.types';
 import { InjectRepository } from '@nestjs/typeorm';
 import { Repository } from 'typeorm';
 import { ChatSession } from './entities/chat-session.entity';
 import { ChatMessage as ChatMessageEntity } from './entities/chat-message.entity';
-import { v4 as uuidv4 } from 'uuid';
+import { randomUUID } from 'crypto';
+import NodeCache from 'node-cache';
+import { safeCacheSet } from '../infrastructure/cache/safe-cache-set';
 
 // Interface for memory extraction results
 export interface MemoryExtraction {
@@ -36,6 +39,17 @@ export class ChatService {
   // Request deduplication to prevent duplicate processing
   private activeRequests = new Map<string, boolean>();
 
+  // Upper bound on messages loaded into memory as model context per request
+  private readonly HISTORY_MESSAGE_LIMIT: number;
+
+  // Users known to have no sessions anywhere, so lists skip the chain lookup until expiry
+  private readonly emptySessionUsers = new NodeCache({
+    stdTTL: 60,
+    checkperiod: 120,
+    useClones: false,
+    maxKeys: 10000
+  });
+
   constructor(
     private geminiService: GeminiService,
     private suiService: SuiService,
@@ -46,12 +60,15 @@ export class ChatService {
     private chatSessionRepository: Repository<ChatSession>,
     @InjectRepository(ChatMessageEntity)
     private chatMessageRepository: Repository<ChatMessageEntity>,
-  ) {}
+    private configService: ConfigService,
+  ) {
+    this.HISTORY_MESSAGE_LIMIT = this.configService.get<number>('CHAT_HISTORY_MESSAGE_LIMIT', 100);
+  }
 
   /**
    * Get all chat sessions for a user
    */
-  async getSessions(userAddress: string): Promise<{ success: boolean, sessions: ChatSessionType[], message?: string }> {
+  async getSessions(userAddress: string): Promise<{ success: boolean, sessions: ChatSessionListItem[], message?: string }> {
     try {
       // First try to get sessions from PostgreSQL
       const dbSessions = await this.chatSessionRepository.find({
@@ -61,7 +78,7 @@ export class ChatService {
 
       if (dbSessions.length > 0) {
         // Convert DB sessions to expected format
-        const sessions = dbSessions.map(session => ({
+        const sessions: ChatSessionListItem[] = dbSessions.map(session => ({
           id: session.id,
           owner: session.userAddress,
           title: session.title,
@@ -69,7 +86,7 @@ export class ChatService {
           created_at: session.createdAt.toISOString(),
           updated_at: session.updatedAt.toISOString(),
           message_count: 0, // Will be populated when needed
-        } as ChatSessionType));
+        }));
 
         return {
           success: true,
@@ -77,26 +94,37 @@ export class ChatService {
         };
       }
 
+      if (this.emptySessionUsers.has(userAddress)) {
+        return {
+          success: true,
+          sessions: []
+        };
+      }
+
       // Fallback to blockchain if no sessions in DB
       const blockchainSessions = await this.suiService.getChatSessions(userAddress);
       
-      // Store blockchain sessions in PostgreSQL for future use
+      if (blockchainSessions.length === 0) {
+        safeCacheSet(this.emptySessionUsers, userAddress, true);
+      } else {
+        this.emptySessionUsers.del(userAddress);
+      }
+      
+      // Store blockchain sessions in PostgreSQL for future use, in a single batch
       if (blockchainSessions.length > 0) {
-        await Promise.all(blockchainSessions.map(async (session) => {
-          try {
-            await this.chatSessionRepository.save({
-              id: session.id,
-              title: session.title,
-              summary: session.summary,
-              userAddress,
-              suiObjectId: session.id,
-              isArchived: false,
-              metadata: { source: 'blockchain' }
-            });
-          } catch (err) {
-            this.logger.error(`Error saving blockchain session to DB: ${err.message}`);
-          }
-        }));
+        try {
+          await this.chatSessionRepository.save(blockchainSessions.map(session => ({
+            id: session.id,
+            title: session.title,
+            summary: session.summary,
+            userAddress,
+            suiObjectId: session.id,
+            isArchived: false,
+            metadata: { source: 'blockchain' }
+          })));
+        } catch (err) {
+          this.logger.error(`Error saving blockchain sessions to DB: ${err.message}`);
+        }
       }
 
       return {
@@ -156,8 +184,11 @@ export class ChatService {
         throw new NotFoundException('Session not found or you do not have access');
       }
       
+      // On-chain sessions carry no timestamps, so format one and reuse it
+      const now = new Date().toISOString();
+      
       // Format the response to match frontend expectations
-              const session = {
+      const session = {
         id: sessionId,
         owner: rawSession.owner,
         title: rawSession.modelName, // Use model name as title
@@ -165,10 +196,10 @@ export class ChatService {
           id: `${sessionId}-${idx}`,
           content: msg.content,
           type: msg.type,
-          timestamp: new Date().toISOString() // In a real system, we'd store this
+          timestamp: now // In a real system, we'd store this
         })),
-        created_at: new Date().toISOString(), // Mock timestamp
-        updated_at: new Date().toISOString(), // Mock timestamp
+        created_at: now, // Mock timestamp
+        updated_at: now, // Mock timestamp
         message_count: rawSession.messages.length,
         sui_object_id: sessionId
       };
@@ -184,16 +215,16 @@ export class ChatService {
           metadata: { source: 'blockchain' }
         });
 
-        // Store messages
-        await Promise.all(rawSession.messages.map(async (msg, idx) => {
-          await this.chatMessageRepository.save({
+        // Store messages in a single batch
+        if (rawSession.messages.length > 0) {
+          await this.chatMessageRepository.save(rawSession.messages.map((msg, idx) => ({
             id: `${sessionId}-${idx}`,
             role: msg.type,
             content: msg.content,
             sessionId: newDbSession.id,
             session: newDbSession
-          });
-        }));
+          })));
+        }
       } catch (err) {
         this.logger.error(`Error saving blockchain session to DB: ${err.message}`);
       }
@@ -221,7 +252,7 @@ export class ChatService {
       }
 
       // Generate a new UUID for the session if not provided
-      const sessionId = createSessionDto.suiObjectId || uuidv4();
+      const sessionId = createSessionDto.suiObjectId || randomUUID();
       
       // Create session in PostgreSQL
       const newSession = {
@@ -237,6 +268,7 @@ export class ChatService {
       };
       
       const dbSession = await this.chatSessionRepository.save(newSession);
+      this.emptySessionUsers.del(createSessionDto.userAddress);
       
       // Format the session for the frontend
       const session = {
@@ -262,7 +294,7 @@ export class ChatService {
    */
   async addMessage(sessionId: string, messageDto: AddMessageDto): Promise<{ success: boolean, message?: string, memoryExtracted?: MemoryExtraction | null }> {
     try {
-      this.logger.log(`Message processing request received for session ${sessionId}`);
+      this.logger.debug(`Message processing request received for session ${sessionId}`);
       
       let memoryExtracted: MemoryExtraction | null = null;
       
@@ -275,44 +307,40 @@ export class ChatService {
             messageDto.userAddress
           );
           
-          this.logger.log('Memory extraction completed', { 
-            hasExtraction: !!memoryExtracted,
-            factsCount: memoryExtracted?.extractedFacts?.length || 0,
-            category: memoryExtracted?.category
-          });
+          this.logger.debug(`Memory extraction completed - hasExtraction: ${!!memoryExtracted}, factsCount: ${memoryExtracted?.extractedFacts?.length || 0}, category: ${memoryExtracted?.category}`);
         } catch (err) {
           this.logger.error(`Memory extraction error: ${err.message}`);
           memoryExtracted = null;
         }
       }
       
-      // Store message in PostgreSQL
+      // Store message in PostgreSQL. The sessionId foreign key already rejects
+      // unknown sessions, so the session isn't looked up first.
       try {
-        const dbSession = await this.chatSessionRepository.findOne({
-          where: { id: sessionId }
-        });
-        
-        if (dbSession) {
-          await this.chatMessageRepository.save({
+        // Saving the message and bumping updatedAt are independent writes
+        await Promise.all([
+          this.chatMessageRepository.save({
             role: messageDto.type,
             content: messageDto.content,
-            sessionId: dbSession.id,
-            session: dbSession,
+            sessionId,
             memoryId: messageDto.memoryId,
             walrusHash: messageDto.walrusHash,
             metadata: {
               memoryExtracted: memoryExtracted ? true : false
             }
-          });
-          
-          // Update session updatedAt timestamp
-          await this.chatSessionRepository.update(
+          }),
+          this.chatSessionRepository.update(
             { id: sessionId },
             { updatedAt: new Date() }
-          );
-        }
+          )
+        ]);
       } catch (err) {
-        this.logger.error(`Error saving message to DB: ${err.message}`);
+        // 23503 is a foreign key violation: the session isn't indexed in the database
+        if (err.code === '23503') {
+          this.logger.debug(`Session ${sessionId} not in database, message not stored`);
+        } else {
+          this.logger.error(`Error saving message to DB: ${err.message}`);
+        }
       }
       
       return { 
@@ -409,18 +437,17 @@ export class ChatService {
         };
         
         const dbSession = await this.chatSessionRepository.save(newSession);
+        this.emptySessionUsers.del(userAddress);
         
-        // Store messages
-        if (rawSession.messages && Array.isArray(rawSession.messages)) {
-          await Promise.all(rawSession.messages.map(async (msg, idx) => {
-            await this.chatMessageRepository.save({
-              id: `${sessionId}-${idx}`,
-              role: msg.type,
-              content: msg.content,
-              sessionId: dbSession.id,
-              session: dbSession
-            });
-          }));
+        // Store messages in a single batch
+        if (rawSession.messages && Array.isArray(rawSession.messages) && rawSession.messages.length > 0) {
+          await this.chatMessageRepository.save(rawSession.messages.map((msg, idx) => ({
+            id: `${sessionId}-${idx}`,
+            role: msg.type,
+            content: msg.content,
+            sessionId: dbSession.id,
+            session: dbSession
+          })));
         }
       } catch (error) {
         this.logger.error(`Error verifying session: ${error.message}`);
@@ -495,7 +522,7 @@ export class ChatService {
         // Mark request as active
         this.activeRequests.set(requestKey, true);
 
-        this.logger.log(`Starting streaming chat - SessionID: ${sessionId}, UserID: ${userId}, Content: "${content}", RequestKey: ${requestKey}`);
+        this.logger.debug(`Starting streaming chat - SessionID: ${sessionId}, UserID: ${userId}, Content: "${content?.substring(0, 100)}..."`);
 
         // Send initial start message
         subject.next({
@@ -518,13 +545,24 @@ export class ChatService {
           throw new Error('Message content is required for streaming chat');
         }
         
-        // Try to get chat history from PostgreSQL first
-        let chatHistory: { role: string, content: string }[] = [];
+        if (messageDto.memoryContext) {
+          this.logger.log('Using provided memory context');
+        }
         
-        const dbSession = await this.chatSessionRepository.findOne({
-          where: { id: sessionId },
-          relations: ['messages']
-        });
+        // The chat history and the relevant memories are independent, so fetch them concurrently
+        const [dbSession, relevantMemories] = await Promise.all([
+          this.findSessionWithRecentMessages(sessionId),
+          messageDto.memoryContext
+            ? Promise.resolve<string[]>([])
+            : this.memoryQueryService.findRelevantMemories(
+                content,
+                userId,
+                messageDto.userSignature
+              )
+        ]);
+        
+        // Prefer chat history from PostgreSQL
+        let chatHistory: { role: string, content: string }[] = [];
         
         if (dbSession && dbSession.messages) {
           chatHistory = dbSession.messages.map(msg => ({
@@ -538,21 +576,6 @@ export class ChatService {
           chatHistory = [...chatSession.messages.map(msg => ({ role: msg.type, content: msg.content })), { role: 'user', content }];
         }
         
-        // Step 2: Use provided context or fetch relevant memories
-        let relevantMemories: string[] = [];
-        
-        if (messageDto.memoryContext) {
-          // Use provided context
-          this.logger.log('Using provided memory context');
-        } else {
-          // Fetch relevant memories
-          relevantMemories = await this.memoryQueryService.findRelevantMemories(
-            content,
-            userId,
-            messageDto.userSignature
-          );
-        }
-        
         // Step 3: Construct the system prompt with context
         const systemPrompt = this.constructPrompt(
           dbSession?.summary || '',
@@ -561,7 +584,7 @@ export class ChatService {
         );
         
         // Step 4: Stream response from Gemini
-        this.logger.log(`Generating AI response for: "${content}" with model: ${modelName}`);
+        this.logger.debug(`Generating AI response for: "${content?.substring(0, 100)}..." with model: ${modelName}`);
         const responseStream = this.geminiService.generateContentStream(
           modelName,
           chatHistory,
@@ -604,7 +627,7 @@ export class ChatService {
 
                 // Save user message if it doesn't exist
                 if (!existingUserMessage) {
-                  this.logger.log(`Saving user message: "${userMessage}"`);
+                  this.logger.debug(`Saving user message: "${userMessage?.substring(0, 100)}..."`);
                   await this.chatMessageRepository.save({
                     role: 'user',
                     content: userMessage,
@@ -612,11 +635,11 @@ export class ChatService {
                     session: dbSession
                   });
                 } else {
-                  this.logger.log(`User message already exists, skipping save: "${userMessage}"`);
+                  this.logger.debug(`User message already exists, skipping save: "${userMessage?.substring(0, 100)}..."`);
                 }
 
                 // Save assistant message
-                this.logger.log(`Saving assistant message: "${fullResponse.substring(0, 100)}..."`);
+                this.logger.debug(`Saving assistant message: "${fullResponse.substring(0, 100)}..."`);
                 await this.chatMessageRepository.save({
                   role: 'assistant',
                   content: fullResponse,
@@ -710,13 +733,24 @@ export class ChatService {
         throw new Error('Message content is required for chat');
       }
       
-      // Try to get chat history from PostgreSQL first
-      let chatHistory: { role: string, content: string }[] = [];
+      if (messageDto.memoryContext) {
+        this.logger.log('Using provided memory context');
+      }
       
-      const dbSession = await this.chatSessionRepository.findOne({
-        where: { id: sessionId },
-        relations: ['messages']
-      });
+      // The chat history and the relevant memories are independent, so fetch them concurrently
+      const [dbSession, relevantMemories] = await Promise.all([
+        this.findSessionWithRecentMessages(sessionId),
+        messageDto.memoryContext
+          ? Promise.resolve<string[]>([])
+          : this.memoryQueryService.findRelevantMemories(
+              content,
+              userId,
+              messageDto.userSignature
+            )
+      ]);
+      
+      // Prefer chat history from PostgreSQL
+      let chatHistory: { role: string, content: string }[] = [];
       
       if (dbSession && dbSession.messages) {
         chatHistory = dbSession.messages.map(msg => ({
@@ -730,21 +764,6 @@ export class ChatService {
         chatHistory = [...chatSession.messages.map(msg => ({ role: msg.type, content: msg.content })), { role: 'user', content }];
       }
       
-      // Step 2: Use provided context or fetch relevant memories
-      let relevantMemories: string[] = [];
-      
-      if (messageDto.memoryContext) {
-        // Use provided context
-        this.logger.log('Using provided memory context');
-      } else {
-        // Fetch relevant memories
-        relevantMemories = await this.memoryQueryService.findRelevantMemories(
-            content,
-            userId,
-            messageDto.userSignature
-          );
-      }
-      
       // Step 3: Construct the system prompt with context
       const systemPrompt = this.constructPrompt(
         dbSession?.summary || '',
@@ -815,6 +834,29 @@ export class ChatService {
     }
   }
 
+  /**
+   * Load a session with only its most recent messages, oldest first
+   */
+  private async findSessionWithRecentMessages(sessionId: string): Promise<ChatSession | null> {
+    const [dbSession, recentMessages] = await Promise.all([
+      this.chatSessionRepository.findOne({
+        where: { id: sessionId }
+      }),
+      this.chatMessageRepository.find({
+        where: { sessionId },
+        order: { createdAt: 'DESC' },
+        take: this.HISTORY_MESSAGE_LIMIT
+      })
+    ]);
+    
+    if (!dbSession) {
+      return null;
+    }
+    
+    dbSession.messages = recentMessages.reverse();
+    return dbSession;
+  }
+
   private constructPrompt(
     sessionSummary: string,
     relevantMemories: string[],
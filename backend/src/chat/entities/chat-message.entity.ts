@@ -1,4 +1,4 @@
-import { Entity, Column, PrimaryGeneratedColumn, CreateDateColumn, ManyToOne, JoinColumn } from 'typeorm';
+import { Entity, Column, PrimaryGeneratedColumn, CreateDateColumn, ManyToOne, JoinColumn, Index } from 'typeorm';
 import { ChatSession } from './chat-session.entity';
 
 @Entity('chat_message')
@@ -19,6 +19,7 @@ export class ChatMessage {
   @JoinColumn()
   session: ChatSession;
 
+  @Index('IDX_CHAT_MESSAGE_SESSION_ID')
   @Column()
   sessionId: string;
 
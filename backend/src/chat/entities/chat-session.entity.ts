@@ -1,7 +1,8 @@
-import { Entity, Column, PrimaryColumn, CreateDateColumn, UpdateDateColumn, OneToMany } from 'typeorm';
+import { Entity, Column, PrimaryColumn, CreateDateColumn, UpdateDateColumn, OneToMany, Index } from 'typeorm';
 import { ChatMessage } from './chat-message.entity';
 
 @Entity('chat_session')
+@Index('IDX_CHAT_SESSION_USER_ADDRESS_UPDATED_AT', ['userAddress', 'updatedAt'])
 export class ChatSession {
   @PrimaryColumn()
   id: string;
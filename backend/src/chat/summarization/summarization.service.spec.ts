@@ -16,3 +16,79 @@ describe('SummarizationService', () => {
     expect(service).toBeDefined();
   });
 });
+
+describe('SummarizationService queue', () => {
+  const userAddress = '0x' + 'c'.repeat(64);
+  const session = {
+    messages: Array.from({ length: 11 }, (_, i) => ({ type: i % 2 ? 'assistant' : 'user', content: `message ${i}` })),
+    summary: '',
+  };
+  let service: SummarizationService;
+  let suiService: { getChatSession: jest.Mock; saveSessionSummary: jest.Mock };
+  let geminiService: { generateContent: jest.Mock };
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    suiService = {
+      getChatSession: jest.fn().mockResolvedValue(session),
+      saveSessionSummary: jest.fn().mockResolvedValue(true),
+    };
+    geminiService = { generateContent: jest.fn().mockResolvedValue('summary') };
+    service = new SummarizationService(suiService as any, geminiService as any);
+  });
+
+  afterEach(() => {
+    service.onModuleDestroy();
+    jest.useRealTimers();
+  });
+
+  it('coalesces repeated requests for a session into one summary per tick', async () => {
+    await service.summarizeSessionIfNeeded('session-1', userAddress);
+    await service.summarizeSessionIfNeeded('session-1', userAddress);
+    await service.summarizeSessionIfNeeded('session-2', userAddress);
+
+    await jest.advanceTimersByTimeAsync(5000);
+
+    expect(suiService.getChatSession).toHaveBeenCalledTimes(2);
+    expect(suiService.saveSessionSummary).toHaveBeenCalledTimes(2);
+    expect(suiService.saveSessionSummary).toHaveBeenCalledWith('session-1', userAddress, 'summary');
+  });
+
+  it('does nothing on a tick with an empty queue', async () => {
+    await jest.advanceTimersByTimeAsync(10000);
+
+    expect(suiService.getChatSession).not.toHaveBeenCalled();
+  });
+
+  it('holds a session back while its previous summary is still in flight', async () => {
+    let finishSave: () => void = () => undefined;
+    suiService.saveSessionSummary.mockReturnValueOnce(new Promise<boolean>(resolve => {
+      finishSave = () => resolve(true);
+    }));
+
+    await service.summarizeSessionIfNeeded('session-1', userAddress);
+    await jest.advanceTimersByTimeAsync(5000);
+    expect(suiService.saveSessionSummary).toHaveBeenCalledTimes(1);
+
+    // Requeued while the first save is pending: the next tick must not start a second one
+    await service.summarizeSessionIfNeeded('session-1', userAddress);
+    await service.summarizeSessionIfNeeded('session-2', userAddress);
+    await jest.advanceTimersByTimeAsync(5000);
+    expect(suiService.saveSessionSummary).toHaveBeenCalledTimes(2);
+    expect(suiService.saveSessionSummary).toHaveBeenLastCalledWith('session-2', userAddress, 'summary');
+
+    finishSave();
+    await jest.advanceTimersByTimeAsync(5000);
+    expect(suiService.saveSessionSummary).toHaveBeenCalledTimes(3);
+    expect(suiService.saveSessionSummary).toHaveBeenLastCalledWith('session-1', userAddress, 'summary');
+  });
+
+  it('stops the flush timer on module destroy', async () => {
+    service.onModuleDestroy();
+    await service.summarizeSessionIfNeeded('session-1', userAddress);
+
+    await jest.advanceTimersByTimeAsync(10000);
+
+    expect(suiService.getChatSession).not.toHaveBeenCalled();
+  });
+});
@@ -1,17 +1,59 @@
-import { Injectable, Logger } from '@nestjs/common';
+import { Injectable, Logger, OnModuleDestroy } from '@nestjs/common';
 import { SuiService } from '../../infrastructure/sui/sui.service';
 import { GeminiService } from '../../infrastructure/gemini/gemini.service';
 
 @Injectable()
-export class SummarizationService {
+export class SummarizationService implements OnModuleDestroy {
   private logger = new Logger(SummarizationService.name);
+  private readonly pendingSummaries = new Map<string, string>(); // sessionId -> userAddress
+  private readonly activeSummaries = new Set<string>(); // Sessions with a summary transaction in flight
+  private readonly SUMMARY_DELAY_MS = 5000; // Coalesce summarization requests over 5 seconds
+  private readonly flushTimer: NodeJS.Timeout;
 
   constructor(
     private suiService: SuiService,
     private geminiService: GeminiService
-  ) {}
+  ) {
+    // Periodically run coalesced summarization requests
+    this.flushTimer = setInterval(() => this.flushPendingSummaries(), this.SUMMARY_DELAY_MS);
+  }
+
+  onModuleDestroy(): void {
+    clearInterval(this.flushTimer);
+  }
 
+  /**
+   * Queue a session for summarization; a burst of messages results in
+   * one session fetch and at most one summary transaction
+   */
   async summarizeSessionIfNeeded(sessionId: string, userAddress: string): Promise<void> {
+    this.pendingSummaries.set(sessionId, userAddress);
+  }
+
+  /**
+   * Summarize every queued session that isn't already being summarized
+   */
+  private async flushPendingSummaries(): Promise<void> {
+    // Sessions still being summarized stay queued for a later tick, so two
+    // summary transactions never race on the same shared session object
+    const batch: [string, string][] = [];
+    for (const [sessionId, userAddress] of this.pendingSummaries) {
+      if (this.activeSummaries.has(sessionId)) continue;
+      batch.push([sessionId, userAddress]);
+      this.pendingSummaries.delete(sessionId);
+    }
+
+    await Promise.all(batch.map(async ([sessionId, userAddress]) => {
+      this.activeSummaries.add(sessionId);
+      try {
+        await this.summarizeSession(sessionId, userAddress);
+      } finally {
+        this.activeSummaries.delete(sessionId);
+      }
+    }));
+  }
+
+  private async summarizeSession(sessionId: string, userAddress: string): Promise<void> {
     try {
       // Get the chat session
       const session = await this.suiService.getChatSession(sessionId);
@@ -0,0 +1,24 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class AddChatSessionOwnerUpdatedIndex1704412800000 implements MigrationInterface {
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        // Session lists filter by owner and order by most recent activity; a composite
+        // index lets Postgres return rows already ordered instead of sorting per request.
+        // Ascending order matches the entity metadata, and Postgres scans it backwards for DESC.
+        // It also covers owner-only lookups, so the single-column owner index is dropped.
+        await queryRunner.query(`
+            CREATE INDEX IF NOT EXISTS "IDX_CHAT_SESSION_USER_ADDRESS_UPDATED_AT"
+            ON "chat_session" ("userAddress", "updatedAt");
+
+            DROP INDEX IF EXISTS "IDX_CHAT_SESSION_USER_ADDRESS";
+        `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`
+            CREATE INDEX IF NOT EXISTS "IDX_CHAT_SESSION_USER_ADDRESS" ON "chat_session" ("userAddress");
+
+            DROP INDEX IF EXISTS "IDX_CHAT_SESSION_USER_ADDRESS_UPDATED_AT";
+        `);
+    }
+}
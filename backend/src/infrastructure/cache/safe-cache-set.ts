@@ -0,0 +1,14 @@
+import NodeCache from 'node-cache';
+
+/**
+ * Store a value in a NodeCache without failing the caller once the cache is full.
+ * NodeCache throws ECACHEFULL when maxKeys is reached; callers treat caching as best-effort.
+ * Returns whether the value was cached.
+ */
+export function safeCacheSet<T>(cache: NodeCache, key: string, value: T, ttl?: number): boolean {
+  try {
+    return ttl === undefined ? cache.set(key, value) : cache.set(key, value, ttl);
+  } catch {
+    return false;
+  }
+}
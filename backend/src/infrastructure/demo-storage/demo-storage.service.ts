@@ -66,7 +66,7 @@ export class DemoStorageService {
         createdAt: new Date().toISOString(),
         storageType: 'demo'
       };
-      await writeFile(metaPath, JSON.stringify(metadata, null, 2));
+      await writeFile(metaPath, JSON.stringify(metadata));
       
       this.logger.log(`Content stored: ${blobId} for ${ownerAddress}`);
       return blobId;
@@ -106,7 +106,7 @@ export class DemoStorageService {
         createdAt: new Date().toISOString(),
         storageType: 'demo'
       };
-      await writeFile(metaPath, JSON.stringify(metadata, null, 2));
+      await writeFile(metaPath, JSON.stringify(metadata));
       
       this.logger.log(`File stored: ${blobId} (${filename}) for ${ownerAddress}`);
       return blobId;
@@ -85,7 +85,7 @@ export class LocalStorageService {
         createdAt: new Date().toISOString(),
         storageType: 'local'
       };
-      await writeFile(metaPath, JSON.stringify(metadata, null, 2));
+      await writeFile(metaPath, JSON.stringify(metadata));
       
       this.logger.log(`File stored locally: ${blobId} (${buffer.length} bytes)`);
       return blobId;
@@ -191,7 +191,8 @@ export class LocalStorageService {
         }
       }
       
-      return metadata.sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime());
+      // createdAt is written with toISOString(), so string order is time order
+      return metadata.sort((a, b) => (a.createdAt < b.createdAt ? 1 : a.createdAt > b.createdAt ? -1 : 0));
     } catch (error) {
       this.logger.error(`Failed to list files: ${error.message}`);
       return [];
@@ -1,6 +1,9 @@
 import { Controller, Post, Get, Delete, Body, Param, HttpException, HttpStatus, Logger } from '@nestjs/common';
 import { SealService } from './seal.service';
 
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
 export class CreateAllowlistDto {
   name: string;
   description?: string;
@@ -80,7 +83,9 @@ export class AllowlistController {
         throw new Error(`Invalid Sui addresses: ${invalidAddresses.join(', ')}`);
       }
 
-      const allowlistId = `allowlist_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+      const now = new Date();
+      const createdAt = now.toISOString();
+      const allowlistId = `allowlist_${now.getTime()}_${Math.random().toString(36).substr(2, 9)}`;
       
       const allowlist: AllowlistPolicy = {
         id: allowlistId,
@@ -88,8 +93,8 @@ export class AllowlistController {
         description: dto.description,
         addresses: [...new Set(dto.addresses)], // Remove duplicates
         owner: dto.userAddress,
-        createdAt: new Date().toISOString(),
-        updatedAt: new Date().toISOString(),
+        createdAt,
+        updatedAt: createdAt,
         isActive: true,
         memoryCount: 0
       };
@@ -116,7 +121,8 @@ export class AllowlistController {
     try {
       const userAllowlists = Array.from(this.allowlists.values())
         .filter(allowlist => allowlist.owner === userAddress)
-        .sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime());
+        // createdAt is always a toISOString() value, so string order is time order
+        .sort((a, b) => (a.createdAt < b.createdAt ? 1 : a.createdAt > b.createdAt ? -1 : 0));
 
       return userAllowlists;
     } catch (error) {
@@ -165,7 +171,6 @@ export class AllowlistController {
       }
       
       allowlist.updatedAt = new Date().toISOString();
-      this.allowlists.set(allowlistId, allowlist);
 
       this.logger.log(`Updated allowlist: ${allowlistId}`);
       return allowlist;
@@ -200,7 +205,6 @@ export class AllowlistController {
 
       allowlist.isActive = !allowlist.isActive;
       allowlist.updatedAt = new Date().toISOString();
-      this.allowlists.set(allowlistId, allowlist);
 
       this.logger.log(`Toggled allowlist ${allowlistId} to ${allowlist.isActive ? 'active' : 'inactive'}`);
       return allowlist;
@@ -280,13 +284,12 @@ export class AllowlistController {
 
       // Create identity for allowlist access
       const identityId = `allowlist_${dto.allowlistId}_${Date.now()}`;
-      const contentBytes = new TextEncoder().encode(dto.content);
+      const contentBytes = textEncoder.encode(dto.content);
 
       const result = await this.sealService.encrypt(contentBytes, identityId);
 
       // Update memory count
       allowlist.memoryCount++;
-      this.allowlists.set(dto.allowlistId, allowlist);
 
       return {
         success: true,
@@ -334,14 +337,14 @@ export class AllowlistController {
       }
 
       // Decrypt content
-      const encryptedBytes = new Uint8Array(Buffer.from(dto.encryptedData, 'base64'));
+      const encryptedBytes = Buffer.from(dto.encryptedData, 'base64');
       const moveCallConstructor = this.sealService.createAllowlistAccessTransaction(
         dto.userAddress,
         allowlist.addresses
       );
       
       const decryptedBytes = await this.sealService.decrypt(encryptedBytes, moveCallConstructor);
-      const content = new TextDecoder().decode(decryptedBytes);
+      const content = textDecoder.decode(decryptedBytes);
 
       return {
         success: true,
@@ -118,10 +118,34 @@ export class AnalyticsController {
   }
 
   private updateMetrics() {
-    this.metrics.totalSessions = this.events.filter(e => e.type === 'session_created').length;
-    this.metrics.totalEncryptions = this.events.filter(e => e.type === 'encryption').length;
-    this.metrics.totalDecryptions = this.events.filter(e => e.type === 'decryption').length;
-    this.metrics.totalErrors = this.events.filter(e => e.type === 'error').length;
+    this.metrics.totalSessions = 0;
+    this.metrics.totalEncryptions = 0;
+    this.metrics.totalDecryptions = 0;
+    this.metrics.totalErrors = 0;
+
+    for (const event of this.events) {
+      this.countEvent(event, 1);
+    }
+  }
+
+  /**
+   * Adjust the running totals for one event entering (+1) or leaving (-1) the log
+   */
+  private countEvent(event: SealEvent, delta: number) {
+    switch (event.type) {
+      case 'session_created':
+        this.metrics.totalSessions += delta;
+        break;
+      case 'encryption':
+        this.metrics.totalEncryptions += delta;
+        break;
+      case 'decryption':
+        this.metrics.totalDecryptions += delta;
+        break;
+      case 'error':
+        this.metrics.totalErrors += delta;
+        break;
+    }
   }
 
   /**
@@ -131,57 +155,79 @@ export class AnalyticsController {
   @Get(':userAddress')
   async getAnalytics(@Param('userAddress') userAddress: string): Promise<SealAnalytics> {
     try {
-      const userEvents = this.events.filter(e => e.userAddress === userAddress);
       const now = new Date();
-      const today = new Date(now.getFullYear(), now.getMonth(), now.getDate());
-      const thisWeek = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000);
-      const thisMonth = new Date(now.getFullYear(), now.getMonth(), 1);
+      const today = new Date(now.getFullYear(), now.getMonth(), now.getDate()).getTime();
+      const thisWeek = now.getTime() - 7 * 24 * 60 * 60 * 1000;
+      const thisMonth = new Date(now.getFullYear(), now.getMonth(), 1).getTime();
+
+      const newTally = () => ({ total: 0, today: 0, thisWeek: 0, thisMonth: 0, durationSum: 0, timedCount: 0 });
+      const sessions = newTally();
+      const encryptions = newTally();
+      const decryptions = newTally();
+      const errors = newTally();
+      const encryptionsByType: Record<string, number> = {};
+      const errorsByType: Record<string, number> = {};
+
+      // Tally every metric in a single pass over the event log
+      for (const e of this.events) {
+        if (e.userAddress !== userAddress) continue;
+
+        let tally: ReturnType<typeof newTally>;
+        if (e.type === 'session_created') {
+          tally = sessions;
+        } else if (e.type === 'encryption') {
+          tally = encryptions;
+          const type = e.metadata.type || 'unknown';
+          encryptionsByType[type] = (encryptionsByType[type] || 0) + 1;
+        } else if (e.type === 'decryption') {
+          tally = decryptions;
+        } else if (e.type === 'error') {
+          tally = errors;
+          const type = e.metadata.error || 'unknown';
+          errorsByType[type] = (errorsByType[type] || 0) + 1;
+        } else {
+          continue;
+        }
+
+        tally.total++;
+        if (e.duration) {
+          tally.durationSum += e.duration;
+          tally.timedCount++;
+        }
+
+        const timestamp = Date.parse(e.timestamp);
+        if (timestamp >= today) tally.today++;
+        if (timestamp >= thisWeek) tally.thisWeek++;
+        if (timestamp >= thisMonth) tally.thisMonth++;
+      }
 
       // Overview stats
-      const totalSessions = userEvents.filter(e => e.type === 'session_created').length;
+      const totalSessions = sessions.total;
       const activeSessions = await this.getActiveSessionsCount(userAddress);
-      const totalEncryptions = userEvents.filter(e => e.type === 'encryption').length;
-      const totalDecryptions = userEvents.filter(e => e.type === 'decryption').length;
-      const totalErrors = userEvents.filter(e => e.type === 'error').length;
+      const totalEncryptions = encryptions.total;
+      const totalDecryptions = decryptions.total;
+      const totalErrors = errors.total;
 
       // Session stats
-      const sessionEvents = userEvents.filter(e => e.type === 'session_created');
-      const averageSessionDuration = sessionEvents.reduce((sum, e) => sum + (e.duration || 0), 0) / sessionEvents.length || 0;
-      const sessionsToday = sessionEvents.filter(e => new Date(e.timestamp) >= today).length;
-      const sessionsThisWeek = sessionEvents.filter(e => new Date(e.timestamp) >= thisWeek).length;
-      const sessionsThisMonth = sessionEvents.filter(e => new Date(e.timestamp) >= thisMonth).length;
+      const averageSessionDuration = sessions.durationSum / sessions.total || 0;
+      const sessionsToday = sessions.today;
+      const sessionsThisWeek = sessions.thisWeek;
+      const sessionsThisMonth = sessions.thisMonth;
 
       // Encryption stats
-      const encryptionEvents = userEvents.filter(e => e.type === 'encryption');
-      const encryptionsByType = encryptionEvents.reduce((acc, e) => {
-        const type = e.metadata.type || 'unknown';
-        acc[type] = (acc[type] || 0) + 1;
-        return acc;
-      }, {} as Record<string, number>);
-      const encryptionsToday = encryptionEvents.filter(e => new Date(e.timestamp) >= today).length;
-      const encryptionsThisWeek = encryptionEvents.filter(e => new Date(e.timestamp) >= thisWeek).length;
-      const encryptionsThisMonth = encryptionEvents.filter(e => new Date(e.timestamp) >= thisMonth).length;
+      const encryptionsToday = encryptions.today;
+      const encryptionsThisWeek = encryptions.thisWeek;
+      const encryptionsThisMonth = encryptions.thisMonth;
 
       // Error stats
-      const errorEvents = userEvents.filter(e => e.type === 'error');
-      const errorsByType = errorEvents.reduce((acc, e) => {
-        const type = e.metadata.error || 'unknown';
-        acc[type] = (acc[type] || 0) + 1;
-        return acc;
-      }, {} as Record<string, number>);
-      const errorsToday = errorEvents.filter(e => new Date(e.timestamp) >= today).length;
-      const errorsThisWeek = errorEvents.filter(e => new Date(e.timestamp) >= thisWeek).length;
-      const errorsThisMonth = errorEvents.filter(e => new Date(e.timestamp) >= thisMonth).length;
+      const errorsToday = errors.today;
+      const errorsThisWeek = errors.thisWeek;
+      const errorsThisMonth = errors.thisMonth;
 
       // Performance metrics
-      const encryptionTimes = encryptionEvents.filter(e => e.duration).map(e => e.duration!);
-      const decryptionEvents = userEvents.filter(e => e.type === 'decryption');
-      const decryptionTimes = decryptionEvents.filter(e => e.duration).map(e => e.duration!);
-      const sessionCreationTimes = sessionEvents.filter(e => e.duration).map(e => e.duration!);
-
-      const averageEncryptionTime = encryptionTimes.reduce((sum, time) => sum + time, 0) / encryptionTimes.length || 0;
-      const averageDecryptionTime = decryptionTimes.reduce((sum, time) => sum + time, 0) / decryptionTimes.length || 0;
-      const averageSessionCreationTime = sessionCreationTimes.reduce((sum, time) => sum + time, 0) / sessionCreationTimes.length || 0;
+      const averageEncryptionTime = encryptions.durationSum / encryptions.timedCount || 0;
+      const averageDecryptionTime = decryptions.durationSum / decryptions.timedCount || 0;
+      const averageSessionCreationTime = sessions.durationSum / sessions.timedCount || 0;
 
       return {
         overview: {
@@ -233,10 +279,13 @@ export class AnalyticsController {
     @Param('userAddress') userAddress: string
   ): Promise<{ events: SealEvent[]; total: number }> {
     try {
-      const userEvents = this.events
-        .filter(e => e.userAddress === userAddress)
-        .sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime())
-        .slice(0, 50); // Last 50 events
+      // Events are appended in time order, so walk back from the newest
+      const userEvents: SealEvent[] = [];
+      for (let i = this.events.length - 1; i >= 0 && userEvents.length < 50; i--) {
+        if (this.events[i].userAddress === userAddress) {
+          userEvents.push(this.events[i]);
+        }
+      }
 
       return {
         events: userEvents,
@@ -275,11 +324,14 @@ export class AnalyticsController {
       };
 
       this.events.push(event);
-      this.updateMetrics();
+      this.countEvent(event, 1);
 
       // Keep only last 1000 events to prevent memory issues
       if (this.events.length > 1000) {
-        this.events = this.events.slice(-1000);
+        const evicted = this.events.splice(0, this.events.length - 1000);
+        for (const old of evicted) {
+          this.countEvent(old, -1);
+        }
       }
 
       this.logger.log(`Logged event: ${event.type} for user ${dto.userAddress}`);
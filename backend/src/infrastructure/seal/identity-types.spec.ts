@@ -0,0 +1,74 @@
+import {
+  IdentityType,
+  createIdentityString,
+  createLegacyConditionalIdentityString,
+  identityMatches,
+} from './identity-types';
+
+describe('identity-types', () => {
+  const userAddress = '0x' + 'a'.repeat(64);
+  const conditions = { minBalance: 100, tokens: ['SUI', 'USDC'] };
+
+  describe('conditional identities', () => {
+    it('pins the cond2 format', () => {
+      expect(createIdentityString({ type: IdentityType.CONDITIONAL, userAddress, conditions }))
+        .toBe(`cond2:${userAddress}:02b0c80a3acc4020c6077f6b4c1610dc`);
+      expect(createIdentityString({ type: IdentityType.CONDITIONAL, userAddress }))
+        .toBe(`cond2:${userAddress}:${'0'.repeat(32)}`);
+    });
+
+    it('pins the legacy cond format', () => {
+      expect(createLegacyConditionalIdentityString({ type: IdentityType.CONDITIONAL, userAddress, conditions }))
+        .toBe(`cond:${userAddress}:7b226d696e42616c`);
+      expect(createLegacyConditionalIdentityString({ type: IdentityType.CONDITIONAL, userAddress }))
+        .toBe(`cond:${userAddress}:0000000000000000`);
+    });
+
+    it('ignores key order', () => {
+      const reordered = { tokens: ['SUI', 'USDC'], minBalance: 100 };
+      expect(createIdentityString({ type: IdentityType.CONDITIONAL, userAddress, conditions: reordered }))
+        .toBe(createIdentityString({ type: IdentityType.CONDITIONAL, userAddress, conditions }));
+    });
+
+    it('distinguishes conditions that differ only by a Date', () => {
+      const first = createIdentityString({
+        type: IdentityType.CONDITIONAL,
+        userAddress,
+        conditions: { until: new Date('2024-01-01T00:00:00.000Z') },
+      });
+      const second = createIdentityString({
+        type: IdentityType.CONDITIONAL,
+        userAddress,
+        conditions: { until: new Date('2024-01-02T00:00:00.000Z') },
+      });
+      expect(first).toBe(`cond2:${userAddress}:dd7998e0a05287eeae78f738ccd814c6`);
+      expect(second).not.toBe(first);
+    });
+
+    it('accepts class instances in conditions', () => {
+      class Threshold {
+        constructor(public readonly value: number) {}
+      }
+      expect(() => createIdentityString({
+        type: IdentityType.CONDITIONAL,
+        userAddress,
+        conditions: { threshold: new Threshold(1) },
+      })).not.toThrow();
+    });
+
+    it('matches both the current and the legacy identity', () => {
+      const options = { type: IdentityType.CONDITIONAL, userAddress, conditions };
+      expect(identityMatches(createIdentityString(options), options)).toBe(true);
+      expect(identityMatches(createLegacyConditionalIdentityString(options), options)).toBe(true);
+      expect(identityMatches(`cond2:${userAddress}:${'f'.repeat(32)}`, options)).toBe(false);
+    });
+  });
+
+  it('leaves other identity types unchanged', () => {
+    expect(createIdentityString({ type: IdentityType.SELF, userAddress })).toBe(`self:${userAddress}`);
+    expect(identityMatches(
+      createLegacyConditionalIdentityString({ type: IdentityType.CONDITIONAL, userAddress }),
+      { type: IdentityType.SELF, userAddress },
+    )).toBe(false);
+  });
+});
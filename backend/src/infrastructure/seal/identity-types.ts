@@ -2,6 +2,8 @@
  * Identity types for SEAL IBE encryption
  */
 
+import { createHash, Hash } from 'crypto';
+
 export enum IdentityType {
   SELF = 'self',              // User encrypts for themselves
   APP = 'app',                // User encrypts for a specific app
@@ -19,6 +21,46 @@ export interface IdentityOptions {
   conditions?: any;          // For CONDITIONAL: custom conditions
 }
 
+/**
+ * Feed a value into a hash in canonical order (sorted keys, length-prefixed leaves)
+ * so equal conditions hash equally without building an intermediate JSON string.
+ * Dates hash by their ISO timestamp; other objects with toJSON hash what it returns,
+ * mirroring JSON.stringify, so class instances don't all collapse to {}
+ */
+function updateHashCanonical(hash: Hash, value: any): void {
+  if (value === null || typeof value !== 'object') {
+    const text = String(value);
+    hash.update(`${typeof value}:${text.length}:${text}`);
+    return;
+  }
+
+  if (value instanceof Date) {
+    // An invalid Date has no ISO form; JSON.stringify would give null, so don't throw here either
+    const text = isNaN(value.getTime()) ? 'invalid' : value.toISOString();
+    hash.update(`date:${text.length}:${text}`);
+    return;
+  }
+
+  if (Array.isArray(value)) {
+    hash.update('[');
+    value.forEach(item => updateHashCanonical(hash, item));
+    hash.update(']');
+    return;
+  }
+
+  if (typeof value.toJSON === 'function') {
+    updateHashCanonical(hash, value.toJSON());
+    return;
+  }
+
+  hash.update('{');
+  for (const key of Object.keys(value).sort()) {
+    hash.update(`${key.length}:${key}=`);
+    updateHashCanonical(hash, value[key]);
+  }
+  hash.update('}');
+}
+
 /**
  * Create an identity string based on the type and options
  */
@@ -50,13 +92,44 @@ export function createIdentityString(options: IdentityOptions): string {
       return `role:${options.userAddress}:${options.role}`;
     
     case IdentityType.CONDITIONAL:
-      // Format: [packageId][userAddress:cond:hash]
-      const condHash = options.conditions ? 
-        Buffer.from(JSON.stringify(options.conditions)).toString('hex').substring(0, 16) : 
-        '0000000000000000';
-      return `cond:${options.userAddress}:${condHash}`;
+      // Format: [packageId][userAddress:cond2:hash]
+      // 16-byte SHAKE256 digest (32 hex chars): a 128-bit tag keeps accidental collisions
+      // between distinct conditions negligible (~2^64 condition sets before a 50% birthday bound).
+      // The cond2 prefix keeps these apart from legacy cond: identities (see createLegacyConditionalIdentityString)
+      let condHash = '0'.repeat(32);
+      if (options.conditions) {
+        const hash = createHash('shake256', { outputLength: 16 });
+        updateHashCanonical(hash, options.conditions);
+        condHash = hash.digest('hex');
+      }
+      return `cond2:${options.userAddress}:${condHash}`;
     
     default:
       throw new Error(`Unknown identity type: ${options.type}`);
   }
-}
\ No newline at end of file
+}
+
+/**
+ * Create a conditional identity string in the original cond: format, whose tag is the
+ * first 16 hex chars of the JSON-encoded conditions. Blobs encrypted before the cond2
+ * format was introduced are bound to this identity.
+ */
+export function createLegacyConditionalIdentityString(options: IdentityOptions): string {
+  const condHash = options.conditions ?
+    Buffer.from(JSON.stringify(options.conditions)).toString('hex').substring(0, 16) :
+    '0000000000000000';
+  return `cond:${options.userAddress}:${condHash}`;
+}
+
+/**
+ * Check whether an identity string was derived from the given options.
+ * Conditional identities match in either the current cond2: or the legacy cond: format,
+ * so data encrypted under either one can still be matched when decrypting.
+ */
+export function identityMatches(identity: string, options: IdentityOptions): boolean {
+  if (identity === createIdentityString(options)) {
+    return true;
+  }
+  return options.type === IdentityType.CONDITIONAL &&
+    identity === createLegacyConditionalIdentityString(options);
+}
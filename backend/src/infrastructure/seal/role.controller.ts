@@ -103,16 +103,19 @@ export class RoleController {
       }
     ];
 
+    const now = new Date();
+    const createdAt = now.toISOString();
+    
     defaultRoles.forEach(roleData => {
-      const roleId = `role_${roleData.name.toLowerCase()}_${Date.now()}`;
+      const roleId = `role_${roleData.name.toLowerCase()}_${now.getTime()}`;
       const role: Role = {
         id: roleId,
         name: roleData.name,
         description: roleData.description,
         permissions: roleData.permissions,
         owner: 'system',
-        createdAt: new Date().toISOString(),
-        updatedAt: new Date().toISOString(),
+        createdAt,
+        updatedAt: createdAt,
         isActive: true,
         memberCount: 0
       };
@@ -138,7 +141,9 @@ export class RoleController {
         throw new Error(`Invalid permissions: ${invalidPermissions.join(', ')}`);
       }
 
-      const roleId = `role_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+      const now = new Date();
+      const createdAt = now.toISOString();
+      const roleId = `role_${now.getTime()}_${Math.random().toString(36).substr(2, 9)}`;
       
       const role: Role = {
         id: roleId,
@@ -146,8 +151,8 @@ export class RoleController {
         description: dto.description,
         permissions: [...new Set(dto.permissions)], // Remove duplicates
         owner: dto.userAddress,
-        createdAt: new Date().toISOString(),
-        updatedAt: new Date().toISOString(),
+        createdAt,
+        updatedAt: createdAt,
         isActive: true,
         memberCount: 0
       };
@@ -175,7 +180,8 @@ export class RoleController {
       // Get roles owned by user + system roles
       const userRoles = Array.from(this.roles.values())
         .filter(role => role.owner === userAddress || role.owner === 'system')
-        .sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime());
+        // createdAt is always a toISOString() value, so string order is time order
+        .sort((a, b) => (a.createdAt < b.createdAt ? 1 : a.createdAt > b.createdAt ? -1 : 0));
 
       return userRoles;
     } catch (error) {
@@ -257,14 +263,15 @@ export class RoleController {
         throw new HttpException('Role already assigned to user', HttpStatus.BAD_REQUEST);
       }
 
-      const assignmentId = `assignment_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+      const now = new Date();
+      const assignmentId = `assignment_${now.getTime()}_${Math.random().toString(36).substr(2, 9)}`;
       
       const assignment: RoleAssignment = {
         id: assignmentId,
         roleId,
         userAddress: dto.userAddress,
         assignedBy: dto.assignedBy,
-        assignedAt: new Date().toISOString(),
+        assignedAt: now.toISOString(),
         isActive: true
       };
 
@@ -272,7 +279,6 @@ export class RoleController {
 
       // Update member count
       role.memberCount++;
-      this.roles.set(roleId, role);
 
       this.logger.log(`Assigned role ${roleId} to user ${dto.userAddress}`);
       return assignment;
@@ -327,11 +333,9 @@ export class RoleController {
       }
 
       assignment.isActive = false;
-      this.roleAssignments.set(assignment.id, assignment);
 
       // Update member count
       role.memberCount = Math.max(0, role.memberCount - 1);
-      this.roles.set(roleId, role);
 
       this.logger.log(`Revoked role ${roleId} from user ${userAddress}`);
       return {
@@ -1,10 +1,13 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { SealClient, EncryptedObject, SessionKey } from '@mysten/seal';
-import { SuiClient, getFullnodeUrl } from '@mysten/sui/client';
+import { SuiClient } from '@mysten/sui/client';
 import { Transaction } from '@mysten/sui/transactions';
 import { SessionKeyService } from './session-key.service';
 
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
 /**
  * Simplified SEAL service following the official examples
  * Based on @mysten/seal API patterns from the MystenLabs/seal repository
@@ -39,10 +42,8 @@ export class SealService {
     const network = this.configService.get<'mainnet' | 'testnet' | 'devnet'>('SEAL_NETWORK', 'testnet');
     this.packageId = this.configService.get<string>('SEAL_PACKAGE_ID', '0xa2b73c54b9f354050462547787463e79f33b48fc6c1fea35673f12e3a535ec60');
 
-    // Initialize Sui client
-    this.suiClient = new SuiClient({
-      url: this.configService.get<string>('SUI_RPC_URL', getFullnodeUrl(network))
-    });
+    // Reuse the session key service's Sui client so all SEAL calls share one connection pool
+    this.suiClient = this.sessionKeyService.getSuiClient();
 
     // Initialize SEAL client with configured key servers
     const keyServerIds = this.configService.get<string[]>('SEAL_KEY_SERVER_IDS', [
@@ -59,10 +60,8 @@ export class SealService {
     this.threshold = this.configService.get<number>('SEAL_THRESHOLD', 2);
     this.isOpenMode = false; // Disable open mode - use standard SEAL Client only
 
-    // Initialize Sui client following SDK examples
-    this.suiClient = new SuiClient({ 
-      url: this.configService.get<string>('SUI_RPC_URL', getFullnodeUrl(this.network))
-    });
+    // Reuse the session key service's Sui client so all SEAL calls share one connection pool
+    this.suiClient = this.sessionKeyService.getSuiClient();
 
     // Initialize SEAL client with proper configuration based on SDK documentation
     // Use the same key servers as in the example app
@@ -79,6 +78,8 @@ export class SealService {
     this.sealClient = new SealClient({
       suiClient: this.suiClient as any, // Type assertion to bypass compatibility issue
       serverConfigs,
+      // Bound key server calls so a slow server fails fast instead of stalling decrypts
+      timeout: this.configService.get<number>('SEAL_KEY_SERVER_TIMEOUT_MS', 10_000),
 <<<<<<< HEAD
       verifyKeyServers: false,
     });
@@ -118,14 +119,14 @@ export class SealService {
   ): Promise<{ encrypted: string; backupKey: string }> {
     try {
       // Convert content to bytes
-      const data = new TextEncoder().encode(content);
+      const data = textEncoder.encode(content);
       
       // Use configured package ID (no custom packages in standard mode)
       const packageIdToUse = this.packageId;
       
       // Standard SEAL identity format following SDK patterns
       const identityString = `self:${userAddress}`;
-      const identityBytes = new TextEncoder().encode(identityString);
+      const identityBytes = textEncoder.encode(identityString);
       const id = toHEX(identityBytes);
       
       this.logger.debug(`Encrypting with identity: ${identityString}`);
@@ -142,8 +143,8 @@ export class SealService {
 
 <<<<<<< HEAD
 =======
-      // Convert encrypted bytes to base64 for storage
-      const encrypted = Buffer.from(encryptedObject).toString('base64');
+      // Convert encrypted bytes to base64 for storage, viewing the bytes rather than copying them
+      const encrypted = Buffer.from(encryptedObject.buffer, encryptedObject.byteOffset, encryptedObject.byteLength).toString('base64');
       const backupKeyHex = toHEX(backupKey);
 
       this.logger.debug(`Successfully encrypted content for user ${userAddress}`);
@@ -220,13 +221,12 @@ export class SealService {
       // Get or create session key following SDK patterns
       const sessionKey = await this.getOrCreateSessionKey(userAddress, signature, packageIdToUse);
       
-      // Convert encrypted content from base64 to bytes
-      const encryptedBytes = new Uint8Array(Buffer.from(encryptedContent, 'base64'));
+      // Convert encrypted content from base64 to bytes (a Buffer is already a Uint8Array)
+      const encryptedBytes = Buffer.from(encryptedContent, 'base64');
       
       // Standard SEAL identity format following SDK patterns
       const identityString = `self:${userAddress}`;
-      const identityBytes = new TextEncoder().encode(identityString);
-      const id = toHEX(identityBytes);
+      const identityBytes = textEncoder.encode(identityString);
       
       this.logger.debug(`Decrypting with identity: ${identityString}`);
       this.logger.debug(`Package: ${packageIdToUse}, Module: ${moduleNameToUse}`);
@@ -236,7 +236,7 @@ export class SealService {
       tx.moveCall({
         target: `${packageIdToUse}::${moduleNameToUse}::seal_approve_self`,
         arguments: [
-          tx.pure.vector("u8", fromHEX(id)),
+          tx.pure.vector("u8", identityBytes),
         ]
       });
       
@@ -255,7 +255,7 @@ export class SealService {
       });
 
       // Convert decrypted bytes to string
-      const decrypted = new TextDecoder().decode(decryptedBytes);
+      const decrypted = textDecoder.decode(decryptedBytes);
       
       this.logger.debug(`Successfully decrypted content for user ${userAddress}`);
       
@@ -518,7 +518,7 @@ export class SealService {
       tx.moveCall({
         target: `${this.packageId}::seal_access_control::seal_approve`,
         arguments: [
-          tx.pure.vector('u8', Array.from(new TextEncoder().encode(id))),
+          tx.pure.vector('u8', textEncoder.encode(id)),
         ],
       });
     };
@@ -533,7 +533,7 @@ export class SealService {
         target: `${this.packageId}::seal_access_control::seal_approve_app`,
         arguments: [
           tx.object(allowlistId),
-          tx.pure.vector('u8', Array.from(new TextEncoder().encode(id))),
+          tx.pure.vector('u8', textEncoder.encode(id)),
         ],
       });
     };
@@ -548,7 +548,7 @@ export class SealService {
         target: `${this.packageId}::seal_access_control::seal_approve_timelock`,
         arguments: [
           tx.object(timelockId),
-          tx.pure.vector('u8', Array.from(new TextEncoder().encode(id))),
+          tx.pure.vector('u8', textEncoder.encode(id)),
         ],
       });
     };
@@ -637,12 +637,14 @@ export class SealService {
   ): Promise<{ encrypted: string; backupKey: string }> {
     try {
       // Convert content to bytes
-      const data = new TextEncoder().encode(content);
+      const data = textEncoder.encode(content);
       
       // Create identity with allowlist namespace prefix (following example pattern)
       const nonce = crypto.getRandomValues(new Uint8Array(5));
       const allowlistBytes = fromHEX(allowlistId.replace('0x', ''));
-      const identityBytes = new Uint8Array([...allowlistBytes, ...nonce]);
+      const identityBytes = new Uint8Array(allowlistBytes.length + nonce.length);
+      identityBytes.set(allowlistBytes);
+      identityBytes.set(nonce, allowlistBytes.length);
       const id = toHEX(identityBytes);
       
       this.logger.debug(`Encrypting for allowlist: ${allowlistId}`);
@@ -656,8 +658,8 @@ export class SealService {
         data,
       });
 
-      // Convert encrypted bytes to base64 for storage
-      const encrypted = Buffer.from(encryptedObject).toString('base64');
+      // Convert encrypted bytes to base64 for storage, viewing the bytes rather than copying them
+      const encrypted = Buffer.from(encryptedObject.buffer, encryptedObject.byteOffset, encryptedObject.byteLength).toString('base64');
       const backupKeyHex = toHEX(backupKey);
 
       this.logger.debug(`Successfully encrypted content for allowlist ${allowlistId}`);
@@ -744,13 +746,15 @@ export class SealService {
       // Get session key
       const sessionKey = await this.getOrCreateSessionKey(userAddress, signature, this.packageId);
       
-      // Convert encrypted content from base64 to bytes
-      const encryptedBytes = new Uint8Array(Buffer.from(encryptedContent, 'base64'));
+      // Convert encrypted content from base64 to bytes (a Buffer is already a Uint8Array)
+      const encryptedBytes = Buffer.from(encryptedContent, 'base64');
       
       // Create identity with allowlist namespace prefix
       const nonce = crypto.getRandomValues(new Uint8Array(5));
       const allowlistBytes = fromHEX(allowlistId.replace('0x', ''));
-      const identityBytes = new Uint8Array([...allowlistBytes, ...nonce]);
+      const identityBytes = new Uint8Array(allowlistBytes.length + nonce.length);
+      identityBytes.set(allowlistBytes);
+      identityBytes.set(nonce, allowlistBytes.length);
       const id = toHEX(identityBytes);
       
       // Build transaction with seal_approve call for allowlist
@@ -758,7 +762,7 @@ export class SealService {
       tx.moveCall({
         target: `${this.packageId}::${this.moduleName}::seal_approve`,
         arguments: [
-          tx.pure.vector("u8", fromHEX(id)),
+          tx.pure.vector("u8", identityBytes),
           tx.object(allowlistId), // Pass allowlist object for access check
         ]
       });
@@ -800,7 +804,7 @@ export class SealService {
           tx.object(roleRegistryId),
           tx.pure.address(userAddress),
           tx.pure.string(role),
-          tx.pure.vector('u8', Array.from(new TextEncoder().encode(id))),
+          tx.pure.vector('u8', textEncoder.encode(id)),
         ],
       });
     };
@@ -828,7 +832,7 @@ export class SealService {
       tx.moveCall({
         target: `${this.packageId}::seal_access_control::seal_approve_allowlist`,
         arguments: [
-          tx.pure.vector('u8', Array.from(new TextEncoder().encode(id))),
+          tx.pure.vector('u8', textEncoder.encode(id)),
           tx.pure.address(userAddress),
           tx.pure.vector('address', allowedAddresses),
         ],
@@ -837,7 +841,7 @@ export class SealService {
   }
 =======
       // Convert decrypted bytes to string
-      const decrypted = new TextDecoder().decode(decryptedBytes);
+      const decrypted = textDecoder.decode(decryptedBytes);
       
       this.logger.debug(`Successfully decrypted content from allowlist ${allowlistId}`);
       
@@ -2,6 +2,7 @@ import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { SessionKey, type ExportedSessionKey } from '@mysten/seal';
 import { SuiClient, getFullnodeUrl } from '@mysten/sui/client';
+import { getSharedSuiClient } from '../sui/shared-sui-client';
 
 export interface SessionKeyData {
   sessionKey: SessionKey;
@@ -33,11 +34,11 @@ export class SessionKeyService {
   private readonly mvrName: string;
 
   constructor(private readonly configService: ConfigService) {
-    // Initialize Sui client
+    // Use the process-wide Sui client for this RPC URL
     const network = this.configService.get<'mainnet' | 'testnet' | 'devnet'>('SEAL_NETWORK', 'testnet');
-    this.suiClient = new SuiClient({
-      url: this.configService.get<string>('SUI_RPC_URL', getFullnodeUrl(network))
-    });
+    this.suiClient = getSharedSuiClient(
+      this.configService.get<string>('SUI_RPC_URL', getFullnodeUrl(network))
+    );
 
     // Configuration
     this.defaultPackageId = this.configService.get<string>('SEAL_PACKAGE_ID', '0xa2b73c54b9f354050462547787463e79f33b48fc6c1fea35673f12e3a535ec60');
@@ -114,12 +115,9 @@ export class SessionKeyService {
       // Set the signature on the session key
       await sessionData.sessionKey.setPersonalMessageSignature(request.signature);
 
-      // Update the exported key with signature
+      // Update the exported key with signature (the cached entry is mutated in place)
       sessionData.exportedKey = sessionData.sessionKey.export();
 
-      // Update cache
-      this.sessionCache.set(sessionId, sessionData);
-
       this.logger.log(`Session ${sessionId} signed successfully`);
 
       return sessionData;
@@ -142,16 +140,16 @@ export class SessionKeyService {
         return null;
       }
 
-      // Check if session is expired
-      if (sessionData.sessionKey.isExpired() || new Date() > sessionData.expiresAt) {
-        this.logger.debug(`Session expired for user ${userAddress}`);
+      // Verify session belongs to the user (the address is recorded when the key is created)
+      if (sessionData.userAddress !== userAddress) {
+        this.logger.warn(`Session address mismatch for user ${userAddress}`);
         this.sessionCache.delete(sessionId);
         return null;
       }
 
-      // Verify session belongs to the user
-      if (sessionData.sessionKey.getAddress() !== userAddress) {
-        this.logger.warn(`Session address mismatch for user ${userAddress}`);
+      // Check if session is expired
+      if (Date.now() > sessionData.expiresAt.getTime() || sessionData.sessionKey.isExpired()) {
+        this.logger.debug(`Session expired for user ${userAddress}`);
         this.sessionCache.delete(sessionId);
         return null;
       }
@@ -180,7 +178,7 @@ export class SessionKeyService {
       return { exists: false, signed: false, expired: false };
     }
 
-    const isExpired = sessionData.sessionKey.isExpired() || new Date() > sessionData.expiresAt;
+    const isExpired = Date.now() > sessionData.expiresAt.getTime() || sessionData.sessionKey.isExpired();
     const isSigned = !!(sessionData.exportedKey as any).signature;
 
     return {
@@ -237,6 +235,13 @@ export class SessionKeyService {
     return `${userAddress}:${packageId}`;
   }
 
+  /**
+   * Get the shared Sui client so SEAL callers reuse one connection pool
+   */
+  getSuiClient(): SuiClient {
+    return this.suiClient;
+  }
+
   /**
    * Get session cache stats (for debugging)
    */
@@ -1,6 +1,9 @@
 import { Controller, Post, Body, HttpException, HttpStatus, Logger } from '@nestjs/common';
 import { SealService } from './seal.service';
 
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
 export class TimelockEncryptDto {
   content: string;
   unlockTime: string; // ISO string
@@ -55,7 +58,7 @@ export class TimelockController {
       }
 
       // Convert content to bytes
-      const contentBytes = new TextEncoder().encode(dto.content);
+      const contentBytes = textEncoder.encode(dto.content);
 
       // Encrypt with time-lock
       const result = await this.sealService.encryptWithTimelock(
@@ -89,7 +92,7 @@ export class TimelockController {
       this.logger.log(`Decrypting time-locked content for user: ${dto.userAddress}`);
 
       // Decode encrypted data
-      const encryptedBytes = new Uint8Array(Buffer.from(dto.encryptedData, 'base64'));
+      const encryptedBytes = Buffer.from(dto.encryptedData, 'base64');
 
       // Decrypt with time-lock validation
       const decryptedBytes = await this.sealService.decryptTimelock(
@@ -98,7 +101,7 @@ export class TimelockController {
       );
 
       // Convert bytes back to string
-      const content = new TextDecoder().decode(decryptedBytes);
+      const content = textDecoder.decode(decryptedBytes);
 
       return {
         success: true,
@@ -136,7 +139,7 @@ export class TimelockController {
   }> {
     try {
       // Decode and parse encrypted data to extract identity
-      const encryptedBytes = new Uint8Array(Buffer.from(dto.encryptedData, 'base64'));
+      const encryptedBytes = Buffer.from(dto.encryptedData, 'base64');
       
       // This is a simplified check - in a real implementation, you'd parse the EncryptedObject
       // For now, we'll extract from the identity pattern
@@ -16,17 +16,17 @@ export class StorageService {
   private walrusAvailable = false;
   private lastWalrusCheck = 0;
   private readonly WALRUS_CHECK_INTERVAL = 5 * 60 * 1000; // 5 minutes
+  private readonly useLocalForDemo: boolean;
 
   constructor(
     private localStorageService: LocalStorageService,
     private walrusService: WalrusService,
     private configService: ConfigService
   ) {
-    // For demo, we'll primarily use local storage
-    const useLocalForDemo = this.configService.get<boolean>('USE_LOCAL_STORAGE_FOR_DEMO', true);
-    if (useLocalForDemo) {
+    // For demo, we'll primarily use local storage (read once; config doesn't change at runtime)
+    this.useLocalForDemo = this.configService.get<boolean>('USE_LOCAL_STORAGE_FOR_DEMO', true);
+    if (this.useLocalForDemo) {
       this.logger.log('Demo mode: Using local storage as primary storage');
-      this.walrusAvailable = false;
     }
   }
 
@@ -35,8 +35,7 @@ export class StorageService {
    */
   private async isWalrusAvailable(): Promise<boolean> {
     // For demo, always use local storage
-    const useLocalForDemo = this.configService.get<boolean>('USE_LOCAL_STORAGE_FOR_DEMO', true);
-    if (useLocalForDemo) {
+    if (this.useLocalForDemo) {
       return false;
     }
 
@@ -200,12 +199,12 @@ export class StorageService {
   async retrieveFile(blobId: string): Promise<Buffer> {
     // Detect storage type from blob ID
     if (blobId.startsWith('local_')) {
-      this.logger.log(`Retrieving file from local storage: ${blobId}`);
+      this.logger.debug(`Retrieving file from local storage: ${blobId}`);
       return await this.localStorageService.retrieveFile(blobId);
     } else {
       // Try Walrus first, then local as fallback
       try {
-        this.logger.log(`Retrieving file from Walrus: ${blobId}`);
+        this.logger.debug(`Retrieving file from Walrus: ${blobId}`);
         return await this.walrusService.downloadFile(blobId);
       } catch (error) {
         this.logger.warn(`Walrus retrieval failed, trying local storage: ${error.message}`);
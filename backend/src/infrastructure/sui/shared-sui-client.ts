@@ -0,0 +1,16 @@
+import { SuiClient } from '@mysten/sui/client';
+
+// One client per RPC URL for the whole process, so services reuse the same connections
+const sharedClients = new Map<string, SuiClient>();
+
+/**
+ * Get the process-wide SuiClient for an RPC URL, creating it on first use
+ */
+export function getSharedSuiClient(url: string): SuiClient {
+  let client = sharedClients.get(url);
+  if (!client) {
+    client = new SuiClient({ url });
+    sharedClients.set(url, client);
+  }
+  return client;
+}
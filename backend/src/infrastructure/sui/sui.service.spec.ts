@@ -1,4 +1,5 @@
 import { Test, TestingModule } from '@nestjs/testing';
+import { ConfigService } from '@nestjs/config';
 import { SuiService } from './sui.service';
 
 describe('SuiService', () => {
@@ -16,3 +17,229 @@ describe('SuiService', () => {
     expect(service).toBeDefined();
   });
 });
+
+describe('SuiService concurrency', () => {
+  const userAddress = '0x' + 'b'.repeat(64);
+  const tx = { setSender: jest.fn() };
+  let service: SuiService;
+  let client: {
+    signAndExecuteTransactionBlock: jest.Mock;
+    getOwnedObjects: jest.Mock;
+    getObject: jest.Mock;
+  };
+
+  const flush = () => new Promise(resolve => setImmediate(resolve));
+
+  const createService = (config: Record<string, any> = {}) => {
+    const configService = {
+      get: jest.fn((key: string, defaultValue?: any) => (key in config ? config[key] : defaultValue)),
+    };
+    service = new SuiService(configService as unknown as ConfigService);
+    client = {
+      signAndExecuteTransactionBlock: jest.fn(),
+      getOwnedObjects: jest.fn(),
+      getObject: jest.fn(),
+    };
+    (service as any).client = client;
+  };
+
+  const executeTransaction = () => (service as any).executeTransaction(tx, userAddress);
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  describe('executeTransaction', () => {
+    it('never has more than SUI_MAX_INFLIGHT_TX transactions outstanding', async () => {
+      createService({ SUI_MAX_INFLIGHT_TX: 2, SUI_TX_PER_SECOND: 100 });
+      const releases: (() => void)[] = [];
+      let active = 0;
+      let maxActive = 0;
+      client.signAndExecuteTransactionBlock.mockImplementation(() => new Promise(resolve => {
+        active++;
+        maxActive = Math.max(maxActive, active);
+        releases.push(() => {
+          active--;
+          resolve({ digest: 'ok' });
+        });
+      }));
+
+      const runs = Array.from({ length: 5 }, () => executeTransaction());
+      await flush();
+      expect(client.signAndExecuteTransactionBlock).toHaveBeenCalledTimes(2);
+
+      releases[0]();
+      await flush();
+      expect(client.signAndExecuteTransactionBlock).toHaveBeenCalledTimes(3);
+
+      for (let i = 1; i < 5; i++) {
+        await flush();
+        releases[i]();
+      }
+      await Promise.all(runs);
+
+      expect(maxActive).toBe(2);
+      expect((service as any).inflightTransactions).toBe(0);
+    });
+
+    it('holds transactions beyond SUI_TX_PER_SECOND until the next window', async () => {
+      jest.useFakeTimers();
+      createService({ SUI_TX_PER_SECOND: 2 });
+      client.signAndExecuteTransactionBlock.mockResolvedValue({ digest: 'ok' });
+
+      const runs = Array.from({ length: 3 }, () => executeTransaction());
+      await jest.advanceTimersByTimeAsync(0);
+      expect(client.signAndExecuteTransactionBlock).toHaveBeenCalledTimes(2);
+
+      await jest.advanceTimersByTimeAsync(1000);
+      expect(client.signAndExecuteTransactionBlock).toHaveBeenCalledTimes(3);
+      await Promise.all(runs);
+    });
+
+    it('retries a rate-limited (429) submission with backoff', async () => {
+      jest.useFakeTimers();
+      createService();
+      client.signAndExecuteTransactionBlock
+        .mockRejectedValueOnce(Object.assign(new Error('Too Many Requests'), { status: 429 }))
+        .mockResolvedValueOnce({ digest: 'ok' });
+
+      const run = executeTransaction();
+      await jest.advanceTimersByTimeAsync(0);
+      expect(client.signAndExecuteTransactionBlock).toHaveBeenCalledTimes(1);
+
+      await jest.advanceTimersByTimeAsync(500);
+      await expect(run).resolves.toEqual({ digest: 'ok' });
+      expect(client.signAndExecuteTransactionBlock).toHaveBeenCalledTimes(2);
+    });
+
+    it('gives up on 429 after the attempt limit', async () => {
+      jest.useFakeTimers();
+      createService();
+      client.signAndExecuteTransactionBlock.mockRejectedValue(
+        Object.assign(new Error('Too Many Requests'), { status: 429 }),
+      );
+
+      const assertion = expect(executeTransaction()).rejects.toMatchObject({ status: 429 });
+      await jest.advanceTimersByTimeAsync(500 + 1000);
+      await assertion;
+      expect(client.signAndExecuteTransactionBlock).toHaveBeenCalledTimes(3);
+    });
+
+    it('does not retry other failures', async () => {
+      createService();
+      client.signAndExecuteTransactionBlock.mockRejectedValue(
+        Object.assign(new Error('Internal error'), { status: 500 }),
+      );
+
+      await expect(executeTransaction()).rejects.toMatchObject({ status: 500 });
+      expect(client.signAndExecuteTransactionBlock).toHaveBeenCalledTimes(1);
+    });
+  });
+
+  describe('getUserMemories', () => {
+    const page = {
+      data: [{
+        data: {
+          objectId: '0xm1',
+          content: { fields: { category: 'personal', blob_id: 'blob1', vector_id: '7' } },
+        },
+      }],
+      hasNextPage: false,
+      nextCursor: null,
+    };
+
+    it('shares one read between concurrent callers and caches the result', async () => {
+      createService();
+      client.getOwnedObjects.mockResolvedValue(page);
+
+      const [first, second] = await Promise.all([
+        service.getUserMemories(userAddress),
+        service.getUserMemories(userAddress),
+      ]);
+      await service.getUserMemories(userAddress);
+
+      expect(first).toEqual([{ id: '0xm1', category: 'personal', blobId: 'blob1', vectorId: 7 }]);
+      expect(second).toBe(first);
+      expect(client.getOwnedObjects).toHaveBeenCalledTimes(1);
+    });
+
+    it('reads again after a write invalidates the cache', async () => {
+      createService();
+      client.getOwnedObjects.mockResolvedValue(page);
+
+      await service.getUserMemories(userAddress);
+      (service as any).invalidateUserMemories(userAddress);
+      await service.getUserMemories(userAddress);
+
+      expect(client.getOwnedObjects).toHaveBeenCalledTimes(2);
+    });
+
+    it('does not cache a load that was invalidated while in flight', async () => {
+      createService();
+      client.getOwnedObjects.mockResolvedValue(page);
+
+      const stale = service.getUserMemories(userAddress);
+      (service as any).invalidateUserMemories(userAddress);
+      await stale;
+      await service.getUserMemories(userAddress);
+
+      expect(client.getOwnedObjects).toHaveBeenCalledTimes(2);
+    });
+
+    it('does not cache a failed read', async () => {
+      createService();
+      client.getOwnedObjects
+        .mockRejectedValueOnce(new Error('invalid params'))
+        .mockResolvedValueOnce(page);
+
+      await expect(service.getUserMemories(userAddress)).rejects.toThrow('Failed to get user memories');
+      await expect(service.getUserMemories(userAddress)).resolves.toHaveLength(1);
+      expect(client.getOwnedObjects).toHaveBeenCalledTimes(2);
+    });
+  });
+
+  describe('object reads', () => {
+    it('shares one getObject between concurrent lookups of the same ID', async () => {
+      createService();
+      let resolveRead: (value: any) => void = () => undefined;
+      client.getObject.mockReturnValue(new Promise(resolve => { resolveRead = resolve; }));
+
+      const lookups = Promise.all([
+        service.getMemoryIndex('0xindex'),
+        service.getMemoryIndex('0xindex'),
+      ]);
+      resolveRead({
+        data: {
+          content: {
+            fields: { owner: userAddress, version: '3', index_blob_id: 'idx', graph_blob_id: 'graph' },
+          },
+        },
+      });
+      const [first, second] = await lookups;
+
+      expect(first).toEqual({ owner: userAddress, version: 3, indexBlobId: 'idx', graphBlobId: 'graph' });
+      expect(second).toEqual(first);
+      expect(client.getObject).toHaveBeenCalledTimes(1);
+    });
+
+    it('retries a transient read failure', async () => {
+      jest.useFakeTimers();
+      createService();
+      client.getObject
+        .mockRejectedValueOnce(new Error('fetch failed'))
+        .mockResolvedValueOnce({
+          data: {
+            content: {
+              fields: { owner: userAddress, version: '1', index_blob_id: 'idx', graph_blob_id: 'graph' },
+            },
+          },
+        });
+
+      const lookup = service.getMemoryIndex('0xindex');
+      await jest.advanceTimersByTimeAsync(500);
+
+      await expect(lookup).resolves.toMatchObject({ version: 1 });
+      expect(client.getObject).toHaveBeenCalledTimes(2);
+    });
+  });
+});
@@ -6,16 +6,97 @@ import {
 } from '@mysten/sui.js/client';
 import { TransactionBlock } from '@mysten/sui.js/transactions';
 import { Ed25519Keypair } from '@mysten/sui.js/keypairs/ed25519';
-import { ChatMessage, ChatSession } from '../../types/chat.types';
+import NodeCache from 'node-cache';
+import { safeCacheSet } from '../cache/safe-cache-set';
+import { ChatMessage, ChatSessionListItem } from '../../types/chat.types';
+
+// Maximum objects returned by a single suix_getOwnedObjects page
+const OWNED_OBJECTS_PAGE_LIMIT = 50;
+
+// Attempts for a transaction the fullnode rejected with HTTP 429
+const RATE_LIMITED_MAX_ATTEMPTS = 3;
+
+// Attempts and backoff bounds for idempotent reads that hit a transient failure
+const READ_MAX_ATTEMPTS = 3;
+const READ_RETRY_BASE_MS = 50;
+const READ_RETRY_CAP_MS = 500;
+
+/**
+ * Whether an RPC error is worth retrying (rate limits, server errors, dropped connections)
+ */
+function isTransientRpcError(error: any): boolean {
+  if (typeof error?.status === 'number') {
+    return error.status === 429 || error.status >= 500;
+  }
+  return /fetch failed|timeout|ECONNRESET|socket hang up/i.test(String(error?.message || ''));
+}
+
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
+/**
+ * Move call targets and struct types for a package, built once per service
+ */
+function buildMoveTargets(packageId: string) {
+  return Object.freeze({
+    chatSessionType: `${packageId}::chat_sessions::ChatSession`,
+    createSession: `${packageId}::chat_sessions::create_session`,
+    addMessageToSession: `${packageId}::chat_sessions::add_message_to_session`,
+    saveSessionSummary: `${packageId}::chat_sessions::save_session_summary`,
+    memoryType: `${packageId}::memory::Memory`,
+    memoryIndexType: `${packageId}::memory::MemoryIndex`,
+    createMemoryRecord: `${packageId}::memory::create_memory_record`,
+    createMemoryIndex: `${packageId}::memory::create_memory_index`,
+    updateMemoryIndex: `${packageId}::memory::update_memory_index`,
+    appPermissionType: `${packageId}::seal_access_control::AppPermission`,
+    grantAppPermission: `${packageId}::seal_access_control::grant_app_permission`,
+    revokeAppPermission: `${packageId}::seal_access_control::revoke_app_permission`,
+  });
+}
+
+interface UserMemoryRecord {
+  id: string;
+  category: string;
+  blobId: string;
+  vectorId: number;
+}
 
 @Injectable()
 export class SuiService {
   private client: SuiClient;
   private packageId: string;
+  private targets: ReturnType<typeof buildMoveTargets>;
   private adminKeypair: Ed25519Keypair;
   private logger = new Logger(SuiService.name);
+  private readonly TX_PER_SECOND: number;
+  private txWindowStart = 0;
+  private txWindowCount = 0;
+  private readonly MAX_INFLIGHT_TRANSACTIONS: number;
+  private inflightTransactions = 0;
+  private transactionWaiters: (() => void)[] = [];
+  private saturatedTransactionWaits = 0;
+  
+  // Memory lists are polled by the UI, so serve repeats from a short-lived cache
+  private userMemoriesCache: NodeCache;
+  private pendingUserMemories = new Map<string, Promise<UserMemoryRecord[]>>();
+  
+  // In-flight object reads, so concurrent lookups of one object share a request
+  private pendingObjectReads = new Map<string, ReturnType<SuiClient['getObject']>>();
 
   constructor(private configService: ConfigService) {
+    // Transactions allowed per one-second window before callers wait for the next one
+    this.TX_PER_SECOND = this.configService.get<number>('SUI_TX_PER_SECOND', 10);
+    // Transactions allowed to wait on the fullnode at once
+    this.MAX_INFLIGHT_TRANSACTIONS = this.configService.get<number>('SUI_MAX_INFLIGHT_TX', 16);
+    
+    this.userMemoriesCache = new NodeCache({
+      stdTTL: this.configService.get<number>('SUI_USER_MEMORIES_CACHE_TTL', 5),
+      checkperiod: 60,
+      useClones: false,
+      maxKeys: 10000
+    });
+    
+
     // Initialize Sui client
     const network = this.configService.get<string>('SUI_NETWORK', 'testnet');
     
@@ -54,6 +135,7 @@ export class SuiService {
     }
     
     this.logger.log(`Using SUI_PACKAGE_ID: ${this.packageId}`); // Log the package ID being used
+    this.targets = buildMoveTargets(this.packageId);
     
     // Initialize admin keypair for gas
     let privateKey = this.configService.get<string>('SUI_ADMIN_PRIVATE_KEY');
@@ -94,20 +176,22 @@ export class SuiService {
   /**
    * Get all chat sessions for a user
    */
-  async getChatSessions(userAddress: string): Promise<ChatSession[]> {
+  async getChatSessions(userAddress: string): Promise<ChatSessionListItem[]> {
     try {
       // Query all ChatSession objects owned by the user
-      const response = await this.client.getOwnedObjects({
+      const response = await this.withReadRetry(() => this.client.getOwnedObjects({
         owner: userAddress,
         filter: {
-          StructType: `${this.packageId}::chat_sessions::ChatSession`
+          StructType: this.targets.chatSessionType
         },
         options: {
           showContent: true,
         },
-      });
+      }));
 
-      const sessions: ChatSession[] = [];
+      const sessions: ChatSessionListItem[] = [];
+      // Sessions carry no on-chain timestamps, so format one for the whole batch
+      const now = new Date().toISOString();
 
       for (const item of response.data) {
         if (!item.data?.content) continue;
@@ -120,9 +204,8 @@ export class SuiService {
           id: item.data.objectId,
           owner: fields.owner,
           title: fields.model_name, // Use model name as title initially
-          messages: this.deserializeMessages(fields.messages),
-          created_at: new Date().toISOString(), // Use creation time if available
-          updated_at: new Date().toISOString(), // Use update time if available
+          created_at: now, // Use creation time if available
+          updated_at: now, // Use update time if available
           message_count: fields.messages.length,
           sui_object_id: item.data.objectId
         });
@@ -143,13 +226,13 @@ export class SuiService {
       const tx = new TransactionBlock();
       
       tx.moveCall({
-        target: `${this.packageId}::chat_sessions::create_session`,
+        target: this.targets.createSession,
         arguments: [
           tx.pure(modelName),
         ],
       });
 
-      const result = await this.executeTransaction(tx, userAddress);
+      const result = await this.executeTransaction(tx, userAddress, true);
       const objectId = this.extractCreatedObjectId(result);
       
       return objectId;
@@ -173,7 +256,7 @@ export class SuiService {
       
       // Get the chat session object
       tx.moveCall({
-        target: `${this.packageId}::chat_sessions::add_message_to_session`,
+        target: this.targets.addMessageToSession,
         arguments: [
           tx.object(sessionId),
           tx.pure(role),
@@ -201,7 +284,7 @@ export class SuiService {
       const tx = new TransactionBlock();
       
       tx.moveCall({
-        target: `${this.packageId}::chat_sessions::save_session_summary`,
+        target: this.targets.saveSessionSummary,
         arguments: [
           tx.object(sessionId),
           tx.pure(summary),
@@ -226,12 +309,7 @@ export class SuiService {
     summary: string;
   }> {
     try {
-      const object = await this.client.getObject({
-        id: sessionId,
-        options: {
-          showContent: true,
-        },
-      });
+      const object = await this.getObjectWithContent(sessionId);
 
       if (!object || !object.data || !object.data.content) {
         throw new Error(`Chat session ${sessionId} not found`);
@@ -318,7 +396,7 @@ export class SuiService {
       const tx = new TransactionBlock();
       
       tx.moveCall({
-        target: `${this.packageId}::memory::create_memory_record`,
+        target: this.targets.createMemoryRecord,
         arguments: [
           tx.pure(category),
           tx.pure(vectorId),
@@ -326,8 +404,9 @@ export class SuiService {
         ],
       });
 
-      const result = await this.executeTransaction(tx, userAddress);
+      const result = await this.executeTransaction(tx, userAddress, true);
       const objectId = this.extractCreatedObjectId(result);
+      this.invalidateUserMemories(userAddress);
       
       return objectId;
     } catch (error) {
@@ -348,14 +427,14 @@ export class SuiService {
       const tx = new TransactionBlock();
       
       tx.moveCall({
-        target: `${this.packageId}::memory::create_memory_index`,
+        target: this.targets.createMemoryIndex,
         arguments: [
           tx.pure(indexBlobId),
           tx.pure(graphBlobId),
         ],
       });
 
-      const result = await this.executeTransaction(tx, userAddress);
+      const result = await this.executeTransaction(tx, userAddress, true);
       const objectId = this.extractCreatedObjectId(result);
       
       return objectId;
@@ -379,7 +458,7 @@ export class SuiService {
       const tx = new TransactionBlock();
       
       tx.moveCall({
-        target: `${this.packageId}::memory::update_memory_index`,
+        target: this.targets.updateMemoryIndex,
         arguments: [
           tx.object(indexId),
           tx.pure(expectedVersion),
@@ -406,12 +485,7 @@ export class SuiService {
     graphBlobId: string;
   }> {
     try {
-      const object = await this.client.getObject({
-        id: indexId,
-        options: {
-          showContent: true,
-        },
-      });
+      const object = await this.getObjectWithContent(indexId);
 
       if (!object || !object.data || !object.data.content) {
         throw new Error(`Memory index ${indexId} not found`);
@@ -438,109 +512,126 @@ export class SuiService {
     category: string;
     blobId: string;
   }[]> {
-    try {
-      // Query memories owned by this user
-      const response = await this.client.queryTransactionBlocks({
-        filter: {
-          MoveFunction: {
-            package: this.packageId,
-            module: 'memory',
-            function: 'create_memory_record',
-          },
-        },
-        options: {
-          showInput: true,
-          showEffects: true,
-          showEvents: true,
-        },
-      });
+    const memoriesByVectorId = await this.getMemoriesWithVectorIds(userAddress, [vectorId]);
+    return memoriesByVectorId.get(vectorId) || [];
+  }
 
-      const memories = [];
-
-      // Process the transactions to find memories with matching vectorId
-      for (const tx of response.data) {
-        for (const event of tx.events || []) {
-          if (event.type.includes('::memory::MemoryCreated')) {
-            // Check if this memory has the target vectorId and belongs to the user
-            const parsedData = event.parsedJson as any;
-            if (
-              parsedData && 
-              parsedData.owner === userAddress &&
-              Number(parsedData.vector_id) === vectorId
-            ) {
-              // Find the memory object created in this transaction
-              const objectChanges = tx.objectChanges || [];
-              const createdMemory = objectChanges.find(
-                change => change.type === 'created' && 
-                change.objectType.includes('::memory::Memory')
-              );
-              
-              if (createdMemory) {
-                // Get the full memory object to retrieve the blobId
-                const memory = await this.client.getObject({
-                  id: (createdMemory as any).objectId || '',
-                  options: { showContent: true },
-                });
-                
-                if (memory && memory.data && memory.data.content) {
-                  const content = memory.data.content as any;
-                  (memories as any).push({
-                                      id: (createdMemory as any).objectId || '',
-                  category: content.fields.category,
-                  blobId: content.fields.blob_id,
-                  });
-                }
-              }
-            }
-          }
+  /**
+   * Get memories for several vector IDs from the user's cached memory records
+   */
+  async getMemoriesWithVectorIds(userAddress: string, vectorIds: number[]): Promise<Map<number, {
+    id: string;
+    category: string;
+    blobId: string;
+  }[]>> {
+    try {
+      const wantedVectorIds = new Set(vectorIds);
+      const memoriesByVectorId = new Map<number, { id: string; category: string; blobId: string }[]>();
+      
+      // Memory objects are owned by the user and carry their vector ID, so no chain-wide scan is needed
+      const memoryRecords = await this.getUserMemories(userAddress);
+      for (const record of memoryRecords) {
+        if (!wantedVectorIds.has(record.vectorId)) continue;
+        
+        let memories = memoriesByVectorId.get(record.vectorId);
+        if (!memories) {
+          memories = [];
+          memoriesByVectorId.set(record.vectorId, memories);
         }
+        memories.push({
+          id: record.id,
+          category: record.category,
+          blobId: record.blobId,
+        });
       }
 
-      return memories;
+      return memoriesByVectorId;
     } catch (error) {
-      this.logger.error(`Error getting memories with vector ID ${vectorId}: ${error.message}`);
-      return [];
+      this.logger.error(`Error getting memories with vector IDs ${vectorIds.join(', ')}: ${error.message}`);
+      return new Map();
     }
   }
 
   /**
    * Get all memories for a user
    */
-  async getUserMemories(userAddress: string): Promise<{
-    id: string;
-    category: string;
-    blobId: string;
-  }[]> {
-    try {
-      // Query all Memory objects owned by the user
-      const response = await this.client.getOwnedObjects({
-        owner: userAddress,
-        filter: {
-          StructType: `${this.packageId}::memory::Memory`
-        },
-        options: {
-          showContent: true,
-        },
-      });
+  getUserMemories(userAddress: string): Promise<UserMemoryRecord[]> {
+    const cached = this.userMemoriesCache.get<UserMemoryRecord[]>(userAddress);
+    if (cached) {
+      return Promise.resolve(cached);
+    }
+    
+    // Concurrent callers for the same user share one RPC
+    const pending = this.pendingUserMemories.get(userAddress);
+    if (pending) {
+      return pending;
+    }
+    
+    const load = this.fetchUserMemories(userAddress).then(memories => {
+      // Only cache if no write invalidated this load while it was in flight
+      if (this.pendingUserMemories.get(userAddress) === load) {
+        safeCacheSet(this.userMemoriesCache, userAddress, memories);
+      }
+      return memories;
+    }).finally(() => {
+      if (this.pendingUserMemories.get(userAddress) === load) {
+        this.pendingUserMemories.delete(userAddress);
+      }
+    });
+    this.pendingUserMemories.set(userAddress, load);
+    return load;
+  }
 
-      const memories = [];
+  /**
+   * Drop cached memory lists for a user after a write
+   */
+  private invalidateUserMemories(userAddress: string): void {
+    this.userMemoriesCache.del(userAddress);
+    this.pendingUserMemories.delete(userAddress);
+  }
 
-      for (const item of response.data) {
-        if (!item.data?.content) continue;
+  /**
+   * Query the user's Memory objects on-chain
+   */
+  private async fetchUserMemories(userAddress: string): Promise<UserMemoryRecord[]> {
+    try {
+      // Query all Memory objects owned by the user, following the cursor across pages
+      const memories: UserMemoryRecord[] = [];
+      let cursor: string | null | undefined = null;
+
+      do {
+        const response = await this.withReadRetry(() => this.client.getOwnedObjects({
+          owner: userAddress,
+          filter: {
+            StructType: this.targets.memoryType
+          },
+          options: {
+            showContent: true,
+          },
+          cursor,
+          limit: OWNED_OBJECTS_PAGE_LIMIT,
+        }));
+
+        for (const item of response.data) {
+          if (!item.data?.content) continue;
+
+          const fields = (item.data.content as any).fields;
+          memories.push({
+            id: item.data.objectId,
+            category: fields.category,
+            blobId: fields.blob_id,
+            vectorId: Number(fields.vector_id)
+          });
+        }
 
-        const content = item.data.content as any;
-        (memories as any).push({
-          id: item.data.objectId,
-          category: content.fields.category,
-          blobId: content.fields.blob_id,
-          vectorId: Number(content.fields.vector_id)
-        } as any);
-      }
+        cursor = response.hasNextPage ? response.nextCursor : null;
+      } while (cursor);
 
       return memories;
     } catch (error) {
       this.logger.error(`Error getting user memories: ${error.message}`);
-      return [];
+      // Rethrow so getUserMemories doesn't cache an empty list for a failed read
+      throw new Error(`Failed to get user memories: ${error.message}`);
     }
   }
 
@@ -556,15 +647,15 @@ export class SuiService {
   }[]> {
     try {
       // Query all MemoryIndex objects owned by the user
-      const response = await this.client.getOwnedObjects({
+      const response = await this.withReadRetry(() => this.client.getOwnedObjects({
         owner: userAddress,
         filter: {
-          StructType: `${this.packageId}::memory::MemoryIndex`
+          StructType: this.targets.memoryIndexType
         },
         options: {
           showContent: true,
         },
-      });
+      }));
 
       const indexes: Array<{
         id: string;
@@ -577,13 +668,13 @@ export class SuiService {
       for (const item of response.data) {
         if (!item.data?.content) continue;
 
-        const content = item.data.content as any;
+        const fields = (item.data.content as any).fields;
         indexes.push({
           id: item.data.objectId,
-          owner: content.fields.owner,
-          version: Number(content.fields.version),
-          indexBlobId: content.fields.index_blob_id,
-          graphBlobId: content.fields.graph_blob_id,
+          owner: fields.owner,
+          version: Number(fields.version),
+          indexBlobId: fields.index_blob_id,
+          graphBlobId: fields.graph_blob_id,
         });
       }
 
@@ -593,7 +684,7 @@ export class SuiService {
       return indexes;
     } catch (error) {
       this.logger.error(`Error getting user memory indexes: ${error.message}`);
-      return [];
+      throw new Error(`Failed to get user memory indexes: ${error.message}`);
     }
   }
 
@@ -608,12 +699,7 @@ export class SuiService {
     vectorId: number;
   }> {
     try {
-      const object = await this.client.getObject({
-        id: memoryId,
-        options: {
-          showContent: true,
-        },
-      });
+      const object = await this.getObjectWithContent(memoryId);
 
       if (!object || !object.data || !object.data.content) {
         throw new Error(`Memory ${memoryId} not found`);
@@ -655,6 +741,7 @@ export class SuiService {
       );
       
       await this.executeTransaction(tx, userAddress);
+      this.invalidateUserMemories(userAddress);
       return true;
     } catch (error) {
       this.logger.error(`Error deleting memory: ${error.message}`);
@@ -677,10 +764,10 @@ export class SuiService {
       const tx = new TransactionBlock();
       
       // Convert data IDs to vector<vector<u8>>
-      const dataIdBytes = dataIds.map(id => Array.from(new TextEncoder().encode(id)));
+      const dataIdBytes = dataIds.map(id => Array.from(textEncoder.encode(id)));
       
       tx.moveCall({
-        target: `${this.packageId}::seal_access_control::grant_app_permission`,
+        target: this.targets.grantAppPermission,
         arguments: [
           tx.pure(appAddress),
           tx.pure(dataIdBytes),
@@ -689,7 +776,7 @@ export class SuiService {
         ],
       });
 
-      const result = await this.executeTransaction(tx, userAddress);
+      const result = await this.executeTransaction(tx, userAddress, true);
       const permissionId = this.extractCreatedObjectId(result);
       
       this.logger.log(`Granted permission ${permissionId} to app ${appAddress}`);
@@ -712,7 +799,7 @@ export class SuiService {
       const tx = new TransactionBlock();
       
       tx.moveCall({
-        target: `${this.packageId}::seal_access_control::revoke_app_permission`,
+        target: this.targets.revokeAppPermission,
         arguments: [
           tx.object(permissionId),
         ],
@@ -741,12 +828,7 @@ export class SuiService {
     dataIds: string[];
   }> {
     try {
-      const object = await this.client.getObject({
-        id: permissionId,
-        options: {
-          showContent: true,
-        },
-      });
+      const object = await this.getObjectWithContent(permissionId);
 
       if (!object || !object.data || !object.data.content) {
         throw new Error(`Permission ${permissionId} not found`);
@@ -757,7 +839,7 @@ export class SuiService {
       
       // Convert data IDs from bytes to strings
       const dataIds = fields.data_ids.map((idBytes: number[]) => 
-        new TextDecoder().decode(new Uint8Array(idBytes))
+        textDecoder.decode(new Uint8Array(idBytes))
       );
       
       return {
@@ -786,15 +868,15 @@ export class SuiService {
   }>> {
     try {
       // Query all AppPermission objects owned by the user
-      const response = await this.client.getOwnedObjects({
+      const response = await this.withReadRetry(() => this.client.getOwnedObjects({
         owner: userAddress,
         filter: {
-          StructType: `${this.packageId}::seal_access_control::AppPermission`
+          StructType: this.targets.appPermissionType
         },
         options: {
           showContent: true,
         },
-      });
+      }));
 
       const permissions: Array<{
         id: string;
@@ -827,37 +909,143 @@ export class SuiService {
   }
 
   // Helper methods
-  private async executeTransaction(tx: TransactionBlock, sender: string) {
+  private async executeTransaction(tx: TransactionBlock, sender: string, showObjectChanges = false) {
     // Set the sender to the actual user address
     tx.setSender(sender);
     
-    this.logger.log(`Executing transaction for user ${sender}`);
+    this.logger.debug(`Executing transaction for user ${sender}`);
+    
+    await this.acquireInflightSlot();
     
-    // For demonstration purposes in development, we can use the admin keypair
-    // But we use the user's address as sender
     try {
-      return await this.client.signAndExecuteTransactionBlock({
-        transactionBlock: tx,
-        signer: this.adminKeypair,
-        options: {
-          showEffects: true,
-          showEvents: true,
-          showObjectChanges: true,
-        },
-        requestType: 'WaitForLocalExecution',
-      });
-    } catch (error) {
-      this.logger.error(`Transaction execution failed: ${error.message}`);
-      throw error;
+      for (let attempt = 1; ; attempt++) {
+        await this.acquireTransactionSlot();
+      
+        // For demonstration purposes in development, we can use the admin keypair
+        // But we use the user's address as sender
+        try {
+          return await this.client.signAndExecuteTransactionBlock({
+            transactionBlock: tx,
+            signer: this.adminKeypair,
+            // Only ask for object changes when the caller reads a created object ID
+            options: {
+              showEffects: true,
+              showObjectChanges,
+            },
+            requestType: 'WaitForLocalExecution',
+          });
+        } catch (error) {
+          // A 429 is rejected before execution, so resubmitting cannot apply the transaction twice
+          if (error?.status === 429 && attempt < RATE_LIMITED_MAX_ATTEMPTS) {
+            const waitTime = 500 * Math.pow(2, attempt - 1);
+            this.logger.warn(`Transaction rate limited, retrying in ${waitTime}ms (attempt ${attempt}/${RATE_LIMITED_MAX_ATTEMPTS})`);
+            await new Promise(resolve => setTimeout(resolve, waitTime));
+            continue;
+          }
+        
+          this.logger.error(`Transaction execution failed: ${error.message}`);
+          throw error;
+        }
+      }
+    } finally {
+      this.releaseInflightSlot();
+    }
+  }
+
+  /**
+   * Wait until fewer than MAX_INFLIGHT_TRANSACTIONS transactions are outstanding
+   */
+  private async acquireInflightSlot(): Promise<void> {
+    if (this.inflightTransactions < this.MAX_INFLIGHT_TRANSACTIONS) {
+      this.inflightTransactions++;
+      return;
+    }
+    
+    this.saturatedTransactionWaits++;
+    this.logger.debug(`All ${this.MAX_INFLIGHT_TRANSACTIONS} transaction slots busy, queueing (saturated waits: ${this.saturatedTransactionWaits})`);
+    await new Promise<void>(resolve => this.transactionWaiters.push(resolve));
+  }
+
+  /**
+   * Hand a finished transaction's slot to the next waiter, or free it
+   */
+  private releaseInflightSlot(): void {
+    const next = this.transactionWaiters.shift();
+    if (next) {
+      next();
+    } else {
+      this.inflightTransactions--;
+    }
+  }
+
+  /**
+   * Run an idempotent read, retrying transient fullnode failures with jittered backoff
+   */
+  private async withReadRetry<T>(read: () => Promise<T>): Promise<T> {
+    for (let attempt = 1; ; attempt++) {
+      try {
+        return await read();
+      } catch (error) {
+        if (attempt >= READ_MAX_ATTEMPTS || !isTransientRpcError(error)) {
+          throw error;
+        }
+        
+        // Full jitter so retries from concurrent callers don't line up
+        const waitTime = Math.random() * Math.min(READ_RETRY_CAP_MS, READ_RETRY_BASE_MS * Math.pow(2, attempt - 1));
+        this.logger.debug(`Sui read failed (${error.message}), retrying in ${Math.round(waitTime)}ms (attempt ${attempt}/${READ_MAX_ATTEMPTS})`);
+        await new Promise(resolve => setTimeout(resolve, waitTime));
+      }
+    }
+  }
+
+  /**
+   * Fetch an object with its content, sharing the request with concurrent lookups of the same ID
+   */
+  private getObjectWithContent(id: string): ReturnType<SuiClient['getObject']> {
+    const pending = this.pendingObjectReads.get(id);
+    if (pending) {
+      return pending;
+    }
+    
+    const read = this.withReadRetry(() => this.client.getObject({
+      id,
+      options: {
+        showContent: true,
+      },
+    })).finally(() => {
+      this.pendingObjectReads.delete(id);
+    });
+    this.pendingObjectReads.set(id, read);
+    return read;
+  }
+
+  /**
+   * Let transactions through in bursts of TX_PER_SECOND, then wait for the next window
+   */
+  private async acquireTransactionSlot(): Promise<void> {
+    for (;;) {
+      const now = Date.now();
+      
+      if (now - this.txWindowStart >= 1000) {
+        this.txWindowStart = now;
+        this.txWindowCount = 0;
+      }
+      
+      if (this.txWindowCount < this.TX_PER_SECOND) {
+        this.txWindowCount++;
+        return;
+      }
+      
+      await new Promise(resolve => setTimeout(resolve, this.txWindowStart + 1000 - now));
     }
   }
 
   private extractCreatedObjectId(result: any): string {
     try {
       // Extract the object ID from the transaction result
-      const created = result.objectChanges.filter(
+      const created = result.objectChanges.find(
         change => change.type === 'created'
-      )[0];
+      );
       
       return created?.objectId || '';
     } catch (error) {
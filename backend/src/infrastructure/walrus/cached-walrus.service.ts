@@ -2,11 +2,23 @@ import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { WalrusService } from './walrus.service';
 import NodeCache from 'node-cache';
+import { safeCacheSet } from '../cache/safe-cache-set';
+
+interface CachedFile {
+  buffer: Buffer;
+  expiresAt: number;
+}
 
 @Injectable()
 export class CachedWalrusService {
   private logger = new Logger(CachedWalrusService.name);
   private contentCache: NodeCache;
+  // Insertion-ordered map used as an LRU: hits are re-inserted, eviction takes the oldest
+  private readonly fileCache = new Map<string, CachedFile>();
+  private fileCacheBytes = 0;
+  private readonly fileCacheMaxBytes: number;
+  private readonly fileCacheTtlMs: number;
+  private tagsCache: NodeCache;
   
   constructor(
     private readonly walrusService: WalrusService,
@@ -23,6 +35,18 @@ export class CachedWalrusService {
       maxKeys: 10000 // Maximum number of keys
     });
     
+    // Binary blobs (HNSW indexes, graphs, files) can be several MB each, so bound them by total size
+    this.fileCacheMaxBytes = configService.get<number>('WALRUS_FILE_CACHE_MAX_BYTES', 256 * 1024 * 1024);
+    this.fileCacheTtlMs = ttl * 1000;
+    
+    // Blob tags never change, so access checks can reuse them
+    this.tagsCache = new NodeCache({
+      stdTTL: ttl,
+      checkperiod,
+      useClones: false,
+      maxKeys: 10000
+    });
+    
     this.logger.log(`Initialized Walrus cache with TTL: ${ttl}s, check period: ${checkperiod}s`);
   }
   
@@ -51,7 +75,7 @@ export class CachedWalrusService {
     );
     
     // Cache the content after successful upload
-    this.contentCache.set(blobId, content);
+    safeCacheSet(this.contentCache, blobId, content);
     this.logger.debug(`Cached content for blob ID: ${blobId}`);
     
     return blobId;
@@ -75,7 +99,7 @@ export class CachedWalrusService {
       const content = await this.walrusService.retrieveContent(blobId);
       
       // Cache the result
-      this.contentCache.set(blobId, content);
+      safeCacheSet(this.contentCache, blobId, content);
       
       return content;
     } catch (error) {
@@ -85,17 +109,33 @@ export class CachedWalrusService {
   }
   
   /**
-   * Get file tags from Walrus (passthrough)
+   * Get file tags from Walrus with caching
    */
   async getFileTags(blobId: string): Promise<Record<string, string>> {
-    return this.walrusService.getFileTags(blobId);
+    const cachedTags = this.tagsCache.get<Record<string, string>>(blobId);
+    
+    if (cachedTags) {
+      return cachedTags;
+    }
+    
+    const tags = await this.walrusService.getFileTags(blobId);
+    
+    safeCacheSet(this.tagsCache, blobId, tags);
+    
+    return tags;
   }
   
   /**
-   * Check if a user has access to a file (passthrough)
+   * Check if a user has access to a file using cached tags
    */
   async verifyUserAccess(blobId: string, userAddress: string): Promise<boolean> {
-    return this.walrusService.verifyUserAccess(blobId, userAddress);
+    try {
+      const tags = await this.getFileTags(blobId);
+      return this.walrusService.tagsGrantAccess(tags, userAddress);
+    } catch (error) {
+      this.logger.error(`Error verifying user access: ${error.message}`);
+      return false;
+    }
   }
   
   /**
@@ -116,6 +156,9 @@ export class CachedWalrusService {
       additionalTags
     );
     
+    // Cache the buffer so an immediate re-read doesn't hit the network
+    this.cacheFile(blobId, buffer);
+    
     return blobId;
   }
   
@@ -123,9 +166,71 @@ export class CachedWalrusService {
    * Download a file from Walrus with caching
    */
   async downloadFile(blobId: string): Promise<Buffer> {
-    // For binary data, we use a separate method - no caching for now
-    // We could implement this with a more sophisticated cache strategy if needed
-    return this.walrusService.downloadFile(blobId);
+    // Check cache first
+    const cachedFile = this.getCachedFile(blobId);
+    
+    if (cachedFile) {
+      this.logger.debug(`File cache hit for blob ID: ${blobId}`);
+      return cachedFile;
+    }
+    
+    this.logger.debug(`File cache miss for blob ID: ${blobId}, fetching from Walrus`);
+    const buffer = await this.walrusService.downloadFile(blobId);
+    
+    this.cacheFile(blobId, buffer);
+    
+    return buffer;
+  }
+  
+  /**
+   * Get a cached file buffer, marking it most recently used
+   */
+  private getCachedFile(blobId: string): Buffer | undefined {
+    const entry = this.fileCache.get(blobId);
+    if (!entry) {
+      return undefined;
+    }
+    
+    this.fileCache.delete(blobId);
+    if (entry.expiresAt <= Date.now()) {
+      this.fileCacheBytes -= entry.buffer.length;
+      return undefined;
+    }
+    
+    this.fileCache.set(blobId, entry);
+    return entry.buffer;
+  }
+  
+  /**
+   * Store a file buffer in the cache, evicting least recently used files to stay within the byte budget
+   */
+  private cacheFile(blobId: string, buffer: Buffer): void {
+    this.removeCachedFile(blobId);
+    
+    if (buffer.length > this.fileCacheMaxBytes) {
+      this.logger.debug(`Skipping file cache for blob ID ${blobId}: ${buffer.length} bytes exceeds the cache budget`);
+      return;
+    }
+    
+    for (const [oldestBlobId, oldest] of this.fileCache) {
+      if (this.fileCacheBytes + buffer.length <= this.fileCacheMaxBytes) break;
+      this.fileCache.delete(oldestBlobId);
+      this.fileCacheBytes -= oldest.buffer.length;
+    }
+    
+    this.fileCache.set(blobId, { buffer, expiresAt: Date.now() + this.fileCacheTtlMs });
+    this.fileCacheBytes += buffer.length;
+  }
+  
+  /**
+   * Drop a file buffer from the cache
+   */
+  private removeCachedFile(blobId: string): void {
+    const entry = this.fileCache.get(blobId);
+    if (entry) {
+      this.fileCache.delete(blobId);
+      this.fileCacheBytes -= entry.buffer.length;
+    }
   }
   
   /**
@@ -137,6 +242,8 @@ export class CachedWalrusService {
   ): Promise<boolean> {
     // Remove from cache first
     this.contentCache.del(blobId);
+    this.removeCachedFile(blobId);
+    this.tagsCache.del(blobId);
     
     // Then delete from Walrus
     return this.walrusService.deleteContent(blobId, userAddress);
@@ -160,6 +267,9 @@ export class CachedWalrusService {
    */
   clearCache(): void {
     this.contentCache.flushAll();
+    this.fileCache.clear();
+    this.fileCacheBytes = 0;
+    this.tagsCache.flushAll();
     this.logger.log('Walrus content cache cleared');
   }
 }
\ No newline at end of file
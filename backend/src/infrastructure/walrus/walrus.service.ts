@@ -3,6 +3,7 @@ import { ConfigService } from '@nestjs/config';
 import { getFullnodeUrl, SuiClient } from '@mysten/sui/client';
 import { WalrusClient, WalrusFile, RetryableWalrusClientError } from '@mysten/walrus';
 import { Ed25519Keypair } from '@mysten/sui/keypairs/ed25519';
+import { getSharedSuiClient } from '../sui/shared-sui-client';
 import * as fs from 'fs';
 import * as path from 'path';
 import { promisify } from 'util';
@@ -26,7 +27,14 @@ export class WalrusService {
   private readonly LOCAL_STORAGE_DIR = path.join(process.cwd(), 'storage', 'walrus-fallback');
   private walrusAvailable = true;
   private lastWalrusCheck = 0;
+  private availabilityCheck: Promise<boolean> | null = null;
   private readonly WALRUS_CHECK_INTERVAL = 5 * 60 * 1000; // 5 minutes
+  private readonly WALRUS_FAILURE_COOLDOWN = 30 * 1000; // Re-probe 30s after a connectivity failure
+
+  // Concurrent content reads are coalesced into batched getFiles calls
+  private pendingReads = new Map<string, Array<{ resolve: (content: string) => void; reject: (error: Error) => void }>>();
+  private readFlushScheduled = false;
+  private readonly MAX_READ_BATCH_SIZE = 32;
 
   constructor(private configService: ConfigService) {
     // Initialize Sui client with the appropriate network
@@ -35,9 +43,8 @@ export class WalrusService {
     // Validate network for type safety
     const network = configNetwork || 'testnet';
 
-    this.suiClient = new SuiClient({
-      url: getFullnodeUrl(network as 'testnet' | 'mainnet'),
-    });
+    // Share the process-wide Sui client instead of opening another one
+    this.suiClient = getSharedSuiClient(getFullnodeUrl(network as 'testnet' | 'mainnet'));
 
     // Initialize admin keypair for signing transactions
     this.initializeAdminKeypair();
@@ -62,7 +69,8 @@ export class WalrusService {
         suiClient: this.suiClient,
         // Configure storage node options for better reliability
         storageNodeClientOptions: {
-          timeout: 60_000, // 60 seconds as recommended in SDK docs
+          // 60 seconds as recommended in SDK docs
+          timeout: this.configService.get<number>('WALRUS_STORAGE_NODE_TIMEOUT_MS', 60_000),
           onError: (error: Error) => {
             this.logger.debug(`Storage node error: ${error.message}`);
           },
@@ -159,14 +167,34 @@ export class WalrusService {
       return this.walrusAvailable;
     }
 
+    // Concurrent callers share the in-flight probe instead of each issuing one
+    if (!this.availabilityCheck) {
+      this.availabilityCheck = this.probeWalrusAvailability().finally(() => {
+        this.availabilityCheck = null;
+      });
+    }
+
+    return this.availabilityCheck;
+  }
+
+  /**
+   * Probe Walrus and record the result
+   */
+  private async probeWalrusAvailability(): Promise<boolean> {
     try {
       // Quick availability check - try to get a non-existent file
+      const probeTimeout = this.configService.get<number>('WALRUS_AVAILABILITY_TIMEOUT_MS', 5000);
+      let timer: NodeJS.Timeout | undefined;
       const testPromise = this.walrusClient.getFiles({ ids: ['availability-test'] });
       const timeoutPromise = new Promise<never>((_, reject) => {
-        setTimeout(() => reject(new Error('Availability check timeout')), 5000);
+        timer = setTimeout(() => reject(new Error('Availability check timeout')), probeTimeout);
       });
 
-      await Promise.race([testPromise, timeoutPromise]);
+      try {
+        await Promise.race([testPromise, timeoutPromise]);
+      } finally {
+        clearTimeout(timer);
+      }
       this.walrusAvailable = true;
       this.logger.debug('Walrus availability check: AVAILABLE');
     } catch (error: any) {
@@ -182,10 +210,26 @@ export class WalrusService {
       }
     }
 
-    this.lastWalrusCheck = now;
+    this.lastWalrusCheck = Date.now();
     return this.walrusAvailable;
   }
 
+  /**
+   * Mark Walrus unavailable after a connectivity failure so following calls fail fast
+   * (or fall back locally) until the availability probe runs again after a short cooldown
+   */
+  private markWalrusUnavailable(error: Error | null): void {
+    if (!error || !(error.message.includes('fetch failed') ||
+                    error.message.includes('timeout') ||
+                    error.message.includes('network'))) {
+      return;
+    }
+
+    this.walrusAvailable = false;
+    this.lastWalrusCheck = Date.now() - this.WALRUS_CHECK_INTERVAL + this.WALRUS_FAILURE_COOLDOWN;
+    this.logger.warn(`Walrus marked unavailable for ${this.WALRUS_FAILURE_COOLDOWN / 1000}s after connectivity failure`);
+  }
+
   /**
    * Generate a unique blob ID for local storage
    */
@@ -214,7 +258,7 @@ export class WalrusService {
         createdAt: new Date().toISOString(),
         storageType: 'local_fallback'
       };
-      await writeFile(metaPath, JSON.stringify(metadata, null, 2));
+      await writeFile(metaPath, JSON.stringify(metadata));
 
       this.logger.log(`File stored locally: ${blobId} (${buffer.length} bytes)`);
       return blobId;
@@ -232,7 +276,7 @@ export class WalrusService {
 
     try {
       const buffer = await readFile(filePath);
-      this.logger.log(`File retrieved from local storage: ${blobId} (${buffer.length} bytes)`);
+      this.logger.debug(`File retrieved from local storage: ${blobId} (${buffer.length} bytes)`);
       return buffer;
     } catch (error) {
       if (error.code === 'ENOENT') {
@@ -285,11 +329,11 @@ export class WalrusService {
     }
 
     try {
-      this.logger.log(`Uploading content to Walrus for owner ${ownerAddress}...`);
+      this.logger.debug(`Uploading content to Walrus for owner ${ownerAddress}...`);
 
-      // Create a WalrusFile from string content
+      // Create a WalrusFile from the already-encoded content (Buffer is a Uint8Array)
       const file = WalrusFile.from({
-        contents: new TextEncoder().encode(content),
+        contents: buffer,
         identifier: filename,
         tags,
       });
@@ -316,27 +360,79 @@ export class WalrusService {
    */
   async retrieveContent(blobId: string): Promise<string> {
     try {
-      this.logger.log(`Retrieving content from blobId: ${blobId}`);
+      this.logger.debug(`Retrieving content from blobId: ${blobId}`);
       
-      // Get file from the blob ID
-      const [file] = await this.walrusClient.getFiles({ 
-        ids: [blobId] 
+      // Queue the read; reads issued in the same tick share one getFiles call
+      return await new Promise<string>((resolve, reject) => {
+        const waiters = this.pendingReads.get(blobId);
+        if (waiters) {
+          waiters.push({ resolve, reject });
+        } else {
+          this.pendingReads.set(blobId, [{ resolve, reject }]);
+        }
+
+        if (!this.readFlushScheduled) {
+          this.readFlushScheduled = true;
+          setImmediate(() => this.flushPendingReads());
+        }
       });
-      
-      if (!file) {
-        throw new Error(`File with blob ID ${blobId} not found`);
-      }
-      
-      // Convert to text
-      const content = await file.text();
-      
-      return content;
     } catch (error) {
       this.logger.error(`Error retrieving content from Walrus: ${error.message}`);
       throw new Error(`Walrus retrieval error: ${error.message}`);
     }
   }
 
+  /**
+   * Fetch all queued content reads, in chunks of MAX_READ_BATCH_SIZE blob IDs
+   */
+  private async flushPendingReads(): Promise<void> {
+    this.readFlushScheduled = false;
+    const batch = this.pendingReads;
+    this.pendingReads = new Map();
+
+    const blobIds = Array.from(batch.keys());
+    const chunks: string[][] = [];
+    for (let i = 0; i < blobIds.length; i += this.MAX_READ_BATCH_SIZE) {
+      chunks.push(blobIds.slice(i, i + this.MAX_READ_BATCH_SIZE));
+    }
+
+    await Promise.all(chunks.map(chunk => this.resolveReadBatch(chunk, batch)));
+  }
+
+  /**
+   * Read a set of blobs with one getFiles call and settle their waiters
+   */
+  private async resolveReadBatch(
+    blobIds: string[],
+    batch: Map<string, Array<{ resolve: (content: string) => void; reject: (error: Error) => void }>>
+  ): Promise<void> {
+    try {
+      const files = await this.walrusClient.getFiles({ ids: blobIds });
+
+      await Promise.all(blobIds.map(async (blobId, i) => {
+        const waiters = batch.get(blobId) || [];
+        try {
+          if (!files[i]) {
+            throw new Error(`File with blob ID ${blobId} not found`);
+          }
+          const content = await files[i].text();
+          waiters.forEach(waiter => waiter.resolve(content));
+        } catch (error) {
+          waiters.forEach(waiter => waiter.reject(error));
+        }
+      }));
+    } catch (error) {
+      if (blobIds.length === 1) {
+        (batch.get(blobIds[0]) || []).forEach(waiter => waiter.reject(error));
+        return;
+      }
+
+      // Retry individually so one bad blob ID doesn't fail the whole batch
+      this.logger.debug(`Batched read of ${blobIds.length} blobs failed, retrying individually: ${error.message}`);
+      await Promise.all(blobIds.map(blobId => this.resolveReadBatch([blobId], batch)));
+    }
+  }
+
   /**
    * Get file tags from Walrus
    * @param blobId The blob ID
@@ -369,17 +465,27 @@ export class WalrusService {
     try {
       const tags = await this.getFileTags(blobId);
       
-      // Check if user is the owner or has user-address tag
-      return tags['owner'] === userAddress || 
-             tags['user-address'] === userAddress ||
-             // Also check user addresses without 0x prefix
-             tags['user-address'] === userAddress.replace('0x', '');
+      return this.tagsGrantAccess(tags, userAddress);
     } catch (error) {
       this.logger.error(`Error verifying user access: ${error.message}`);
       return false;
     }
   }
 
+  /**
+   * Check whether a blob's tags grant a user access
+   * @param tags The blob's tags
+   * @param userAddress The user's address
+   * @returns True if the user is the owner or the recorded user
+   */
+  tagsGrantAccess(tags: Record<string, string>, userAddress: string): boolean {
+    // Check if user is the owner or has user-address tag
+    return tags['owner'] === userAddress || 
+           tags['user-address'] === userAddress ||
+           // Also check user addresses without 0x prefix
+           tags['user-address'] === userAddress.replace('0x', '');
+  }
+
   /**
    * Upload a file with Walrus/local storage fallback
    * @param buffer The file buffer
@@ -413,11 +519,11 @@ export class WalrusService {
     }
 
     try {
-      this.logger.log(`Uploading file "${filename}" to Walrus for owner ${ownerAddress}...`);
+      this.logger.debug(`Uploading file "${filename}" to Walrus for owner ${ownerAddress}...`);
 
-      // Create a WalrusFile from buffer with filename as identifier
+      // Create a WalrusFile from buffer with filename as identifier (no copy needed)
       const file = WalrusFile.from({
-        contents: new Uint8Array(buffer),
+        contents: buffer,
         identifier: filename,
         tags,
       });
@@ -445,7 +551,7 @@ export class WalrusService {
   async downloadFile(blobId: string): Promise<Buffer> {
     // Check if this is a local blob ID
     if (blobId.startsWith('local_')) {
-      this.logger.log(`Retrieving file from local storage: ${blobId}`);
+      this.logger.debug(`Retrieving file from local storage: ${blobId}`);
       return await this.retrieveFileLocally(blobId);
     }
 
@@ -463,7 +569,7 @@ export class WalrusService {
 
     for (let attempt = 1; attempt <= maxRetries; attempt++) {
       try {
-        this.logger.log(`Downloading file from Walrus: ${blobId} (attempt ${attempt}/${maxRetries})`);
+        this.logger.debug(`Downloading file from Walrus: ${blobId} (attempt ${attempt}/${maxRetries})`);
 
         // Wait before retry (exponential backoff)
         if (attempt > 1) {
@@ -482,8 +588,9 @@ export class WalrusService {
         // Get binary data using SDK method
         const bytes = await file.bytes();
 
-        this.logger.log(`Successfully downloaded file from Walrus: ${blobId} (${bytes.length} bytes)`);
-        return Buffer.from(bytes);
+        this.logger.debug(`Successfully downloaded file from Walrus: ${blobId} (${bytes.length} bytes)`);
+        // Wrap the downloaded bytes without copying them
+        return Buffer.from(bytes.buffer, bytes.byteOffset, bytes.byteLength);
       } catch (error) {
         lastError = error as Error;
         this.logger.warn(`Walrus download attempt ${attempt}/${maxRetries} failed: ${lastError.message}`);
@@ -502,6 +609,7 @@ export class WalrusService {
     }
     
     this.logger.error(`Failed to download file after ${maxRetries} attempts: ${lastError?.message}`);
+    this.markWalrusUnavailable(lastError);
 
     // Provide user-friendly error messages
     if (lastError?.message.includes('fetch failed') ||
@@ -589,7 +697,7 @@ export class WalrusService {
         }
         
         // Use the SDK's recommended writeFiles method (simple and reliable)
-        this.logger.log('Using SDK writeFiles method...');
+        this.logger.debug('Using SDK writeFiles method...');
         const results = await this.walrusClient.writeFiles({
           files,
           epochs,
@@ -597,10 +705,10 @@ export class WalrusService {
           signer: this.adminKeypair,
         });
 
-        this.logger.log(`Upload completed successfully on attempt ${attempt}`);
+        this.logger.debug(`Upload completed successfully on attempt ${attempt}`);
         // Log the blob IDs for debugging
         results.forEach((result, index) => {
-          this.logger.log(`File ${index}: blobId=${result.blobId}`);
+          this.logger.debug(`File ${index}: blobId=${result.blobId}`);
         });
 
         return results;
@@ -628,6 +736,7 @@ export class WalrusService {
     
     // All attempts failed
     this.logger.error(`All ${maxRetries} upload attempts failed. Last error: ${lastError?.message}`);
+    this.markWalrusUnavailable(lastError);
     
     if (lastError?.message.includes('fetch failed') || 
         lastError?.message.includes('Too many failures') ||
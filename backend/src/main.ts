@@ -1,10 +1,15 @@
 import { NestFactory } from '@nestjs/core';
 import { AppModule } from './app.module';
-import { ValidationPipe } from '@nestjs/common';
+import { LogLevel, ValidationPipe } from '@nestjs/common';
 
 async function bootstrap() {
+  // Debug output is opt-in so hot paths don't pay for it in production (e.g. LOG_LEVELS=error,warn,log,debug)
+  const logLevels = (process.env.LOG_LEVELS || 'error,warn,log')
+    .split(',')
+    .map(level => level.trim()) as LogLevel[];
+
   const app = await NestFactory.create(AppModule, {
-    logger: ['error', 'warn', 'log', 'debug'],
+    logger: logLevels,
   });
   
   // Enable CORS
@@ -22,6 +27,9 @@ async function bootstrap() {
 
   // Global prefix for all routes
   app.setGlobalPrefix('api');
+
+  // Run onModuleDestroy on SIGTERM/SIGINT so write-behind queues flush before exit
+  app.enableShutdownHooks();
   
   const port = process.env.PORT || 8000;
   await app.listen(port);
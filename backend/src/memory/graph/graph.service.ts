@@ -243,7 +243,7 @@ export class GraphService {
         throw new Error('User address is required for saving graph');
       }
       
-      this.logger.log(`Saving knowledge graph for user ${userAddress}`);
+      this.logger.debug(`Saving knowledge graph for user ${userAddress}`);
       
       const graphJson = JSON.stringify(graph);
       
@@ -278,7 +278,7 @@ export class GraphService {
    */
   async loadGraph(blobId: string, userAddress?: string): Promise<KnowledgeGraph> {
     try {
-      this.logger.log(`Loading graph from blobId: ${blobId}`);
+      this.logger.debug(`Loading graph from blobId: ${blobId}`);
       
       // Verify user access if an address is provided
       if (userAddress) {
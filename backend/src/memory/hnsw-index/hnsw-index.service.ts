@@ -5,6 +5,31 @@ import { CachedWalrusService } from '../../infrastructure/walrus/cached-walrus.s
 import { DemoStorageService } from '../../infrastructure/demo-storage/demo-storage.service';
 import { ConfigService } from '@nestjs/config';
 
+// Static metadata attached to every serialized index blob
+const INDEX_BLOB_TAGS: Readonly<Record<string, string>> = Object.freeze({
+  'content-type': 'application/hnsw-index',
+  'version': '1.0'
+});
+const INDEX_STORAGE_EPOCHS = 12;
+
+/**
+ * Cosine distance as defined by hnswlib's 'cosine' space (1 - cosine similarity)
+ */
+function cosineDistance(a: number[], b: number[]): number {
+  let dot = 0;
+  let normA = 0;
+  let normB = 0;
+  for (let i = 0; i < a.length; i++) {
+    const x = a[i];
+    const y = b[i];
+    dot += x * y;
+    normA += x * x;
+    normB += y * y;
+  }
+  const denominator = Math.sqrt(normA * normB);
+  return denominator === 0 ? 1 : 1 - dot / denominator;
+}
+
 interface IndexCacheEntry {
   index: hnswlib.HierarchicalNSW;
   lastModified: Date;
@@ -13,9 +38,11 @@ interface IndexCacheEntry {
   version: number;
 }
 
+/**
+ * Pending vectors live only on the cache entry; the job just tracks scheduling
+ */
 interface BatchUpdateJob {
   userAddress: string;
-  vectors: Map<number, number[]>;
   scheduledAt: Date;
 }
 
@@ -24,6 +51,8 @@ export class HnswIndexService {
   private logger = new Logger(HnswIndexService.name);
   private readonly indexCache = new Map<string, IndexCacheEntry>();
   private readonly batchJobs = new Map<string, BatchUpdateJob>();
+  private readonly activeFlushes = new Map<string, Promise<void>>(); // Per-user flush lock
+  private tempFileCounter = 0;
   private readonly BATCH_DELAY_MS = 5000; // 5 seconds
   private readonly MAX_BATCH_SIZE = 50; // Max vectors per batch
   private readonly CACHE_TTL_MS = 30 * 60 * 1000; // 30 minutes
@@ -41,6 +70,13 @@ export class HnswIndexService {
     this.startCacheCleanup();
   }
 
+  /**
+   * Build a unique temp file path; serialization is async, so concurrent calls can't share a name
+   */
+  private createTempFilePath(prefix: string): string {
+    return `./${prefix}${Date.now()}_${++this.tempFileCounter}.bin`;
+  }
+
   /**
    * Get the appropriate storage service based on demo mode
    */
@@ -98,20 +134,36 @@ export class HnswIndexService {
       }
     }
 
-    // Process each job
-    for (const userAddress of jobsToProcess) {
+    // Users have independent indexes, so flush them concurrently
+    await Promise.all(jobsToProcess.map(async (userAddress) => {
       try {
         await this.flushPendingVectors(userAddress);
       } catch (error) {
         this.logger.error(`Error processing batch job for user ${userAddress}: ${error.message}`);
       }
+    }));
+  }
+
+  /**
+   * Flush pending vectors for a user, joining any flush already in progress for that user
+   */
+  private flushPendingVectors(userAddress: string): Promise<void> {
+    const activeFlush = this.activeFlushes.get(userAddress);
+    if (activeFlush) {
+      return activeFlush;
     }
+
+    const flush = this.doFlushPendingVectors(userAddress).finally(() => {
+      this.activeFlushes.delete(userAddress);
+    });
+    this.activeFlushes.set(userAddress, flush);
+    return flush;
   }
 
   /**
    * Flush pending vectors for a user to Walrus
    */
-  private async flushPendingVectors(userAddress: string): Promise<void> {
+  private async doFlushPendingVectors(userAddress: string): Promise<void> {
     const cacheEntry = this.indexCache.get(userAddress);
     if (!cacheEntry || cacheEntry.pendingVectors.size === 0) {
       return;
@@ -132,11 +184,13 @@ export class HnswIndexService {
         cacheEntry.index = newIndex;
       }
 
+      // Snapshot the pending vectors so ones queued during the upload aren't dropped
+      const flushedVectors = Array.from(cacheEntry.pendingVectors.entries());
+
       // Add all pending vectors to the index
-      for (const [vectorId, vector] of cacheEntry.pendingVectors.entries()) {
+      for (const [vectorId, vector] of flushedVectors) {
         try {
           cacheEntry.index.addPoint(vector, vectorId);
-          this.logger.debug(`Added vector ${vectorId} with ${vector.length} dimensions to index for user ${userAddress}`);
         } catch (error) {
           this.logger.error(`Failed to add vector ${vectorId} to index for user ${userAddress}: ${error.message}`);
           this.logger.error(`Vector dimensions: ${vector.length}, Index dimensions: ${cacheEntry.index.getNumDimensions?.() || 'unknown'}`);
@@ -147,14 +201,18 @@ export class HnswIndexService {
       // Save the updated index to Walrus
       const newBlobId = await this.saveIndexToWalrus(cacheEntry.index, userAddress);
 
-      // Clear pending vectors and mark as clean
-      cacheEntry.pendingVectors.clear();
-      cacheEntry.isDirty = false;
+      // Clear the flushed vectors and mark as clean unless more arrived meanwhile
+      for (const [vectorId] of flushedVectors) {
+        cacheEntry.pendingVectors.delete(vectorId);
+      }
+      cacheEntry.isDirty = cacheEntry.pendingVectors.size > 0;
       cacheEntry.lastModified = new Date();
       cacheEntry.version++;
 
-      // Remove the batch job
-      this.batchJobs.delete(userAddress);
+      // Remove the batch job once nothing is left to flush
+      if (!cacheEntry.isDirty) {
+        this.batchJobs.delete(userAddress);
+      }
 
       this.logger.log(`Successfully flushed vectors for user ${userAddress}, new blob ID: ${newBlobId}`);
 
@@ -177,37 +235,35 @@ export class HnswIndexService {
    */
   private async saveIndexToWalrus(index: hnswlib.HierarchicalNSW, userAddress: string): Promise<string> {
     // Create a temporary file path for serialization
-    const tempFilePath = `./tmp_hnsw_${Date.now()}.bin`;
+    const tempFilePath = this.createTempFilePath('tmp_hnsw_');
 
     try {
       // Save the index to the temporary file
-      index.writeIndexSync(tempFilePath);
+      await index.writeIndex(tempFilePath);
 
       // Read the file into a buffer
-      const serialized = fs.readFileSync(tempFilePath);
+      const serialized = await fs.promises.readFile(tempFilePath);
 
       // Get admin address for blob ownership (ensures backend access)
       const storageService = this.getStorageService();
       const adminAddress = storageService.getAdminAddress();
 
       // Save to storage with dual-ownership pattern
+      // - Admin as the actual owner (for backend access)
+      // - User address stored in metadata (for permission checks)
       const blobId = await storageService.uploadFile(
         serialized,
         `index_${userAddress}_${Date.now()}.hnsw`,
         adminAddress, // owner address
-        12, // epochs
-        {
-          'user-address': userAddress,  // Record actual user for permission checks
-          'content-type': 'application/hnsw-index',
-          'version': '1.0'
-        }
+        INDEX_STORAGE_EPOCHS,
+        { ...INDEX_BLOB_TAGS, 'user-address': userAddress }
       );
 
       return blobId;
     } finally {
       // Clean up the temporary file
       try {
-        fs.unlinkSync(tempFilePath);
+        await fs.promises.unlink(tempFilePath);
       } catch (e) {
         // ignore cleanup errors
       }
@@ -272,21 +328,21 @@ export class HnswIndexService {
     const buffer = await storageService.downloadFile(blobId);
 
     // Create a temporary file to load the index
-    const tempFilePath = `./tmp_hnsw_load_${Date.now()}.bin`;
+    const tempFilePath = this.createTempFilePath('tmp_hnsw_load_');
 
     try {
       // Write buffer to temporary file
-      fs.writeFileSync(tempFilePath, buffer);
+      await fs.promises.writeFile(tempFilePath, buffer);
 
       // Load the index from the temporary file
       const index = new hnswlib.HierarchicalNSW('cosine', this.DEFAULT_VECTOR_DIMENSIONS);
-      index.readIndexSync(tempFilePath);
+      await index.readIndex(tempFilePath);
 
       return index;
     } finally {
       // Clean up the temporary file
       try {
-        fs.unlinkSync(tempFilePath);
+        await fs.promises.unlink(tempFilePath);
       } catch (e) {
         // ignore cleanup errors
       }
@@ -311,16 +367,16 @@ export class HnswIndexService {
       index.initIndex(maxElements);
       
       // Create a temporary file path for serialization
-      const tempFilePath = `./tmp_hnsw_${Date.now()}.bin`;
+      const tempFilePath = this.createTempFilePath('tmp_hnsw_');
       
       // Save the index to the temporary file
-      index.writeIndexSync(tempFilePath);
+      await index.writeIndex(tempFilePath);
       
       // Read the file into a buffer
-      const serialized = fs.readFileSync(tempFilePath);
+      const serialized = await fs.promises.readFile(tempFilePath);
       
       // Clean up the temporary file
-      try { fs.unlinkSync(tempFilePath); } catch (e) { /* ignore */ }
+      try { await fs.promises.unlink(tempFilePath); } catch (e) { /* ignore */ }
       
       return { index, serialized };
     } catch (error) {
@@ -373,19 +429,14 @@ export class HnswIndexService {
       cacheEntry.isDirty = true;
       cacheEntry.lastModified = new Date();
 
-      // Schedule or update batch job
-      let batchJob = this.batchJobs.get(userAddress);
-      if (!batchJob) {
-        batchJob = {
+      // Schedule a batch job if one isn't already pending
+      if (!this.batchJobs.has(userAddress)) {
+        this.batchJobs.set(userAddress, {
           userAddress,
-          vectors: new Map(),
           scheduledAt: new Date()
-        };
-        this.batchJobs.set(userAddress, batchJob);
+        });
       }
 
-      batchJob.vectors.set(id, vector);
-
       this.logger.debug(`Vector ${id} queued for batch processing for user ${userAddress}. Pending: ${cacheEntry.pendingVectors.size}`);
 
       // If we've reached the batch size limit, process immediately
@@ -435,21 +486,36 @@ export class HnswIndexService {
       throw new Error(`No index found for user ${userAddress}`);
     }
 
-    // If there are pending vectors, add them to a temporary index for search
+    // If there are pending vectors, merge an exact scan over them with the index results.
+    // There are at most a batch's worth, so scoring them directly is far cheaper than
+    // cloning the whole index through a temp file just to insert them.
     if (cacheEntry.pendingVectors.size > 0) {
-      // Create a temporary index that includes pending vectors
-      const tempIndex = this.cloneIndex(cacheEntry.index);
+      // A flush adds pending vectors to the index before clearing them, so an id can
+      // show up on both sides; keep its closest distance so it fills only one slot
+      const bestDistances = new Map<number, number>();
+      const addCandidate = (id: number, distance: number) => {
+        const best = bestDistances.get(id);
+        if (best === undefined || distance < best) {
+          bestDistances.set(id, distance);
+        }
+      };
+
+      const indexedCount = cacheEntry.index.getCurrentCount();
+      if (indexedCount > 0) {
+        const result = cacheEntry.index.searchKnn(queryVector, Math.min(k, indexedCount));
+        result.neighbors.forEach((id, i) => addCandidate(id, result.distances[i]));
+      }
 
-      // Add pending vectors to the temporary index
       for (const [vectorId, vector] of cacheEntry.pendingVectors.entries()) {
-        tempIndex.addPoint(vector, vectorId);
+        addCandidate(vectorId, cosineDistance(queryVector, vector));
       }
 
-      // Search the temporary index
-      const result = tempIndex.searchKnn(queryVector, k);
+      const candidates = Array.from(bestDistances, ([id, distance]) => ({ id, distance }));
+      candidates.sort((a, b) => a.distance - b.distance);
+      const nearest = candidates.slice(0, k);
       return {
-        ids: result.neighbors,
-        distances: result.distances
+        ids: nearest.map(c => c.id),
+        distances: nearest.map(c => c.distance)
       };
     } else {
       // Search the main index
@@ -461,32 +527,6 @@ export class HnswIndexService {
     }
   }
 
-  /**
-   * Clone an HNSW index (for temporary search operations)
-   */
-  private cloneIndex(originalIndex: hnswlib.HierarchicalNSW): hnswlib.HierarchicalNSW {
-    // Create a temporary file to serialize/deserialize the index
-    const tempFilePath = `./tmp_hnsw_clone_${Date.now()}.bin`;
-
-    try {
-      // Serialize the original index
-      originalIndex.writeIndexSync(tempFilePath);
-
-      // Create a new index and load the serialized data
-      const clonedIndex = new hnswlib.HierarchicalNSW('cosine', this.DEFAULT_VECTOR_DIMENSIONS);
-      clonedIndex.readIndexSync(tempFilePath);
-
-      return clonedIndex;
-    } finally {
-      // Clean up the temporary file
-      try {
-        fs.unlinkSync(tempFilePath);
-      } catch (e) {
-        // ignore cleanup errors
-      }
-    }
-  }
-
   /**
    * Clear user index cache (useful for dimension mismatches)
    */
@@ -581,36 +621,7 @@ export class HnswIndexService {
       
       this.logger.log(`Saving HNSW index for user ${userAddress}`);
       
-      // Create a temporary file path for serialization
-      const tempFilePath = `./tmp_hnsw_${Date.now()}.bin`;
-      
-      // Save the index to the temporary file
-      index.writeIndexSync(tempFilePath);
-      
-      // Read the file into a buffer
-      const serialized = fs.readFileSync(tempFilePath);
-      
-      // Clean up the temporary file
-      try { fs.unlinkSync(tempFilePath); } catch (e) { /* ignore */ }
-      
-      // Get admin address for blob ownership (ensures backend access)
-      const storageService = this.getStorageService();
-      const adminAddress = storageService.getAdminAddress();
-
-      // Save to storage with dual-ownership pattern
-      // - Admin as the actual owner (for backend access)
-      // - User address stored in metadata (for permission checks)
-      const blobId = await storageService.uploadFile(
-        serialized, 
-        `index_${userAddress}_${Date.now()}.hnsw`,
-        adminAddress, // Admin as owner for backend access
-        12, // Default epochs
-        { 
-          'user-address': userAddress,  // Record actual user for permission checks
-          'content-type': 'application/hnsw-index',
-          'version': '1.0'
-        }
-      );
+      const blobId = await this.saveIndexToWalrus(index, userAddress);
       
       this.logger.log(`Index saved to Walrus with blobId ${blobId}`);
       
@@ -633,7 +644,7 @@ export class HnswIndexService {
    */
   async loadIndex(blobId: string, userAddress?: string): Promise<{ index: hnswlib.HierarchicalNSW; serialized: Buffer }> {
     try {
-      this.logger.log(`Loading index from blobId: ${blobId}`);
+      this.logger.debug(`Loading index from blobId: ${blobId}`);
       
       // Verify user access if an address is provided
       const storageService = this.getStorageService();
@@ -649,17 +660,17 @@ export class HnswIndexService {
       const serialized = await storageService.downloadFile(blobId);
       
       // Create a temporary file path
-      const tempFilePath = `./tmp_hnsw_${Date.now()}.bin`;
+      const tempFilePath = this.createTempFilePath('tmp_hnsw_');
       
       // Write the serialized data to the temporary file
-      fs.writeFileSync(tempFilePath, serialized);
+      await fs.promises.writeFile(tempFilePath, serialized);
       
       // Create a new index and load from the file
       const index = new hnswlib.HierarchicalNSW('cosine', 0); // Dimensions will be loaded from file
-      index.readIndexSync(tempFilePath);
+      await index.readIndex(tempFilePath);
       
       // Clean up the temporary file
-      try { fs.unlinkSync(tempFilePath); } catch (e) { /* ignore */ }
+      try { await fs.promises.unlink(tempFilePath); } catch (e) { /* ignore */ }
       
       return { index, serialized };
     } catch (error) {
@@ -3,6 +3,18 @@ import { HnswIndexService } from '../hnsw-index/hnsw-index.service';
 import { GraphService } from '../graph/graph.service';
 import { SuiService } from '../../infrastructure/sui/sui.service';
 import { PrepareIndexResponseDto } from '../dto/prepare-index.dto';
+import NodeCache from 'node-cache';
+import { safeCacheSet } from '../../infrastructure/cache/safe-cache-set';
+
+export interface LoadedMemoryIndex {
+  index?: any;
+  graph?: any;
+  indexId?: string;
+  indexBlobId?: string;
+  graphBlobId?: string;
+  version?: number;
+  exists: boolean;
+}
 
 @Injectable()
 export class MemoryIndexService {
@@ -10,6 +22,17 @@ export class MemoryIndexService {
   
   // Map userAddress to their memory index ID (for frontend-created indexes)
   private userIndexMap = new Map<string, string>();
+  
+  // In-flight index loads, so concurrent requests for a user share one lookup
+  private pendingLoads = new Map<string, Promise<LoadedMemoryIndex>>();
+  
+  // Users with no on-chain index, so repeat ingests skip the lookup RPCs for a while
+  private readonly noIndexUsers = new NodeCache({
+    stdTTL: 60,
+    checkperiod: 120,
+    useClones: false,
+    maxKeys: 10000
+  });
 
   constructor(
     private hnswIndexService: HnswIndexService,
@@ -32,6 +55,7 @@ export class MemoryIndexService {
       }
       
       this.logger.log(`Preparing memory index data for user ${userAddress}`);
+      this.noIndexUsers.del(userAddress);
       
       // Create empty index
       const { index } = await this.hnswIndexService.createIndex();
@@ -80,6 +104,7 @@ export class MemoryIndexService {
       
       // Store the mapping
       this.userIndexMap.set(userAddress, indexId);
+      this.noIndexUsers.del(userAddress);
       
       this.logger.log(`Registered memory index ${indexId} for user ${userAddress}`);
       
@@ -108,6 +133,7 @@ export class MemoryIndexService {
    */
   setIndexId(userAddress: string, indexId: string): void {
     this.userIndexMap.set(userAddress, indexId);
+    this.noIndexUsers.del(userAddress);
   }
   
   /**
@@ -121,15 +147,23 @@ export class MemoryIndexService {
    * Get or load memory index for a user
    * Returns the index data and metadata
    */
-  async getOrLoadIndex(userAddress: string): Promise<{
-    index?: any;
-    graph?: any;
-    indexId?: string;
-    indexBlobId?: string;
-    graphBlobId?: string;
-    version?: number;
-    exists: boolean;
-  }> {
+  getOrLoadIndex(userAddress: string): Promise<LoadedMemoryIndex> {
+    const pending = this.pendingLoads.get(userAddress);
+    if (pending) {
+      return pending;
+    }
+    
+    const load = this.loadIndex(userAddress).finally(() => {
+      this.pendingLoads.delete(userAddress);
+    });
+    this.pendingLoads.set(userAddress, load);
+    return load;
+  }
+  
+  /**
+   * Resolve a user's memory index on-chain and load it from Walrus
+   */
+  private async loadIndex(userAddress: string): Promise<LoadedMemoryIndex> {
     try {
       // Check if we have a stored index ID for this user
       let indexId = this.userIndexMap.get(userAddress);
@@ -146,8 +180,10 @@ export class MemoryIndexService {
             indexId = undefined;
           } else {
             // Load index and graph from Walrus
-            const indexResult = await this.hnswIndexService.loadIndex(memoryIndex.indexBlobId, userAddress);
-            const graph = await this.graphService.loadGraph(memoryIndex.graphBlobId, userAddress);
+            const [indexResult, graph] = await Promise.all([
+              this.hnswIndexService.loadIndex(memoryIndex.indexBlobId, userAddress),
+              this.graphService.loadGraph(memoryIndex.graphBlobId, userAddress)
+            ]);
 
             return {
               index: indexResult.index,
@@ -167,6 +203,17 @@ export class MemoryIndexService {
         }
       }
 
+      // Skip the on-chain lookups for users recently found to have no index
+      if (this.noIndexUsers.has(userAddress)) {
+        return {
+          exists: false
+        };
+      }
+
+      // Only remember "no index" when every lookup below completed and found nothing;
+      // a transient RPC or Walrus failure must not hide an index that does exist
+      let lookupFailed = false;
+
       // Try to get memory index by user address (backward compatibility)
       // But skip loading if we know Walrus is likely down
       try {
@@ -186,8 +233,10 @@ export class MemoryIndexService {
           // Load index and graph from Walrus with better error handling
           try {
             this.logger.log(`Attempting to load existing index for user ${userAddress} from Walrus`);
-            const indexResult = await this.hnswIndexService.loadIndex(memoryIndex.indexBlobId, userAddress);
-            const graph = await this.graphService.loadGraph(memoryIndex.graphBlobId, userAddress);
+            const [indexResult, graph] = await Promise.all([
+              this.hnswIndexService.loadIndex(memoryIndex.indexBlobId, userAddress),
+              this.graphService.loadGraph(memoryIndex.graphBlobId, userAddress)
+            ]);
 
             this.logger.log(`Successfully loaded existing index for user ${userAddress}`);
             return {
@@ -215,6 +264,7 @@ export class MemoryIndexService {
 
             // Clear the invalid mapping and continue to create new index
             this.userIndexMap.delete(userAddress);
+            lookupFailed = true;
             // Don't throw error - let it fall through to create new index
           }
         } else {
@@ -223,6 +273,9 @@ export class MemoryIndexService {
         }
       } catch (error) {
         this.logger.debug(`No index found for user ${userAddress}: ${error.message}`);
+        if (!error.message.includes('not found')) {
+          lookupFailed = true;
+        }
       }
 
       // Try to find any memory index owned by this user
@@ -238,8 +291,10 @@ export class MemoryIndexService {
           this.userIndexMap.set(userAddress, indexId);
 
           // Load index and graph from Walrus
-          const indexResult = await this.hnswIndexService.loadIndex(latestIndex.indexBlobId, userAddress);
-          const graph = await this.graphService.loadGraph(latestIndex.graphBlobId, userAddress);
+          const [indexResult, graph] = await Promise.all([
+            this.hnswIndexService.loadIndex(latestIndex.indexBlobId, userAddress),
+            this.graphService.loadGraph(latestIndex.graphBlobId, userAddress)
+          ]);
 
           this.logger.log(`Found existing index ${indexId} for user ${userAddress}`);
 
@@ -255,9 +310,13 @@ export class MemoryIndexService {
         }
       } catch (error) {
         this.logger.debug(`Failed to find user indexes: ${error.message}`);
+        lookupFailed = true;
       }
 
       // No index exists
+      if (!lookupFailed) {
+        safeCacheSet(this.noIndexUsers, userAddress, true);
+      }
       return {
         exists: false
       };
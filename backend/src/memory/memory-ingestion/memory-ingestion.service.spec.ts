@@ -16,3 +16,99 @@ describe('MemoryIngestionService', () => {
     expect(service).toBeDefined();
   });
 });
+
+describe('MemoryIngestionService graph write-behind', () => {
+  const userAddress = '0x' + 'd'.repeat(64);
+  let service: MemoryIngestionService;
+  let graphService: { saveGraph: jest.Mock };
+  let hnswIndexService: { forceFlush: jest.Mock };
+
+  const queueGraph = (graph: any, user = userAddress) => {
+    (service as any).pendingGraphSaves.set(user, graph);
+  };
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    graphService = { saveGraph: jest.fn().mockResolvedValue('graph-blob') };
+    hnswIndexService = { forceFlush: jest.fn().mockResolvedValue(undefined) };
+    const configService = { get: jest.fn((_key: string, defaultValue?: any) => defaultValue) };
+    service = new MemoryIngestionService(
+      {} as any,
+      {} as any,
+      graphService as any,
+      hnswIndexService as any,
+      {} as any,
+      {} as any,
+      {} as any,
+      {} as any,
+      {} as any,
+      configService as any,
+    );
+  });
+
+  afterEach(async () => {
+    await service.onModuleDestroy();
+    jest.useRealTimers();
+  });
+
+  it('writes only the latest queued graph per user on the next tick', async () => {
+    queueGraph({ version: 1 });
+    queueGraph({ version: 2 });
+    queueGraph({ version: 1 }, '0xother');
+
+    await jest.advanceTimersByTimeAsync(5000);
+
+    expect(graphService.saveGraph).toHaveBeenCalledTimes(2);
+    expect(graphService.saveGraph).toHaveBeenCalledWith({ version: 2 }, userAddress);
+    expect(graphService.saveGraph).toHaveBeenCalledWith({ version: 1 }, '0xother');
+  });
+
+  it('requeues a failed write for the next tick', async () => {
+    graphService.saveGraph.mockRejectedValueOnce(new Error('Walrus unavailable'));
+    queueGraph({ version: 1 });
+
+    await jest.advanceTimersByTimeAsync(5000);
+    await jest.advanceTimersByTimeAsync(5000);
+
+    expect(graphService.saveGraph).toHaveBeenCalledTimes(2);
+    expect(graphService.saveGraph).toHaveBeenLastCalledWith({ version: 1 }, userAddress);
+  });
+
+  it('keeps a newer graph queued during a failed write instead of the stale one', async () => {
+    let failSave: () => void = () => undefined;
+    graphService.saveGraph.mockReturnValueOnce(new Promise((_resolve, reject) => {
+      failSave = () => reject(new Error('Walrus unavailable'));
+    }));
+    queueGraph({ version: 1 });
+
+    await jest.advanceTimersByTimeAsync(5000);
+    queueGraph({ version: 2 });
+    failSave();
+    await jest.advanceTimersByTimeAsync(5000);
+
+    expect(graphService.saveGraph).toHaveBeenCalledTimes(2);
+    expect(graphService.saveGraph).toHaveBeenLastCalledWith({ version: 2 }, userAddress);
+  });
+
+  it('flushes a single user on demand', async () => {
+    queueGraph({ version: 1 });
+    queueGraph({ version: 1 }, '0xother');
+
+    await service.forceFlushUser(userAddress);
+
+    expect(hnswIndexService.forceFlush).toHaveBeenCalledWith(userAddress);
+    expect(graphService.saveGraph).toHaveBeenCalledTimes(1);
+    expect(graphService.saveGraph).toHaveBeenCalledWith({ version: 1 }, userAddress);
+  });
+
+  it('saves pending graphs and stops the timer on module destroy', async () => {
+    queueGraph({ version: 1 });
+
+    await service.onModuleDestroy();
+    expect(graphService.saveGraph).toHaveBeenCalledTimes(1);
+
+    queueGraph({ version: 2 });
+    await jest.advanceTimersByTimeAsync(10000);
+    expect(graphService.saveGraph).toHaveBeenCalledTimes(1);
+  });
+});
@@ -1,4 +1,4 @@
-import { Injectable, Logger } from '@nestjs/common';
+import { Injectable, Logger, OnModuleDestroy } from '@nestjs/common';
 import { ClassifierService } from '../classifier/classifier.service';
 import { EmbeddingService } from '../embedding/embedding.service';
 import { GraphService } from '../graph/graph.service';
@@ -38,10 +38,13 @@ export interface SaveMemoryDto {
 }
 
 @Injectable()
-export class MemoryIngestionService {
+export class MemoryIngestionService implements OnModuleDestroy {
   private readonly logger = new Logger(MemoryIngestionService.name);
   private entityToVectorMap: Record<string, Record<string, number>> = {};
   private nextVectorId: Record<string, number> = {};
+  private readonly pendingGraphSaves = new Map<string, any>(); // userAddress -> latest graph
+  private readonly GRAPH_SAVE_DELAY_MS = 5000; // Coalesce graph writes over 5 seconds
+  private readonly graphFlushTimer: NodeJS.Timeout;
 
   constructor(
     private classifierService: ClassifierService,
@@ -54,7 +57,22 @@ export class MemoryIngestionService {
     private storageService: StorageService,
     private geminiService: GeminiService,
     private configService: ConfigService
-  ) {}
+  ) {
+    // Periodically write coalesced graph updates
+    this.graphFlushTimer = setInterval(() => this.flushPendingGraphs(), this.GRAPH_SAVE_DELAY_MS);
+  }
+
+  /**
+   * Stop the write-behind timer and save any graphs still queued
+   */
+  async onModuleDestroy(): Promise<void> {
+    clearInterval(this.graphFlushTimer);
+    await this.flushPendingGraphs();
+
+    if (this.pendingGraphSaves.size > 0) {
+      this.logger.warn(`Shutting down with ${this.pendingGraphSaves.size} unsaved graph updates: ${Array.from(this.pendingGraphSaves.keys()).join(', ')}`);
+    }
+  }
 
   /**
    * Check if we're in demo mode
@@ -121,7 +139,8 @@ export class MemoryIngestionService {
       // In a full implementation, we'd use an LLM to extract the key information
       const memoryContent = conversation;
       
-      if (!memoryContent || memoryContent.trim() === '') {
+      // Scan for the first non-whitespace character instead of trimming a copy of the whole conversation
+      if (!memoryContent || !/\S/.test(memoryContent)) {
         return { memoryStored: false };
       }
       
@@ -168,8 +187,8 @@ export class MemoryIngestionService {
       let currentVersion = 1;
 
       if (indexData.exists && indexData.indexId && indexData.indexBlobId && indexData.graphBlobId && indexData.version) {
-        // Use existing index data for graph operations
-        graph = indexData.graph;
+        // Use existing index data for graph operations, preferring a graph still waiting to be saved
+        graph = this.pendingGraphSaves.get(memoryDto.userAddress) || indexData.graph;
         indexId = indexData.indexId;
         indexBlobId = indexData.indexBlobId;
         graphBlobId = indexData.graphBlobId;
@@ -230,10 +249,9 @@ export class MemoryIngestionService {
       // Step 8: Save the content to storage
       const contentBlobId = await this.storageService.uploadContent(contentToStore, memoryDto.userAddress);
 
-      // Step 9: Save the updated graph to Walrus (if we have existing graph data)
+      // Step 9: Queue the updated graph so successive memories share one Walrus write
       if (graph && graphBlobId) {
-        const newGraphBlobId = await this.graphService.saveGraph(graph, memoryDto.userAddress);
-        this.logger.log(`Updated graph saved to Walrus: ${newGraphBlobId}`);
+        this.pendingGraphSaves.set(memoryDto.userAddress, graph);
       } else {
         this.logger.log(`New user - graph will be created when first batch is processed`);
       }
@@ -286,8 +304,8 @@ export class MemoryIngestionService {
       let currentVersion = 1;
 
       if (indexData.exists && indexData.indexId && indexData.indexBlobId && indexData.graphBlobId && indexData.version) {
-        // Use existing index data for graph operations
-        graph = indexData.graph;
+        // Use existing index data for graph operations, preferring a graph still waiting to be saved
+        graph = this.pendingGraphSaves.get(userAddress) || indexData.graph;
         indexId = indexData.indexId;
         indexBlobId = indexData.indexBlobId;
         graphBlobId = indexData.graphBlobId;
@@ -346,10 +364,9 @@ export class MemoryIngestionService {
       // Step 8: Save the content to storage
       const contentBlobId = await this.storageService.uploadContent(contentToStore, userAddress);
 
-      // Step 9: Save the updated graph to Walrus (if we have existing graph data)
+      // Step 9: Queue the updated graph so successive memories share one Walrus write
       if (graph && graphBlobId) {
-        const newGraphBlobId = await this.graphService.saveGraph(graph, userAddress);
-        this.logger.log(`Updated graph saved to Walrus: ${newGraphBlobId}`);
+        this.pendingGraphSaves.set(userAddress, graph);
       } else {
         this.logger.log(`New user - graph will be created when first batch is processed`);
       }
@@ -584,6 +601,32 @@ export class MemoryIngestionService {
     }
   }
 
+  /**
+   * Save queued graph updates, one Walrus write per user
+   */
+  private async flushPendingGraphs(userAddress?: string): Promise<void> {
+    const users = userAddress ? [userAddress] : Array.from(this.pendingGraphSaves.keys());
+
+    await Promise.all(users.map(async (user) => {
+      const graph = this.pendingGraphSaves.get(user);
+      if (!graph) {
+        return;
+      }
+      this.pendingGraphSaves.delete(user);
+
+      try {
+        const newGraphBlobId = await this.graphService.saveGraph(graph, user);
+        this.logger.log(`Updated graph saved to Walrus: ${newGraphBlobId}`);
+      } catch (error) {
+        this.logger.error(`Error saving graph for user ${user}: ${error.message}`);
+        // Requeue unless a newer graph was queued meanwhile
+        if (!this.pendingGraphSaves.has(user)) {
+          this.pendingGraphSaves.set(user, graph);
+        }
+      }
+    }));
+  }
+
   /**
    * Get batch processing statistics
    */
@@ -597,6 +640,7 @@ export class MemoryIngestionService {
   async forceFlushUser(userAddress: string): Promise<{ success: boolean; message: string }> {
     try {
       await this.hnswIndexService.forceFlush(userAddress);
+      await this.flushPendingGraphs(userAddress);
       return {
         success: true,
         message: `Successfully flushed pending vectors for user ${userAddress}`
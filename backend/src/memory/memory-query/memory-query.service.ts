@@ -10,6 +10,8 @@ import { MemoryIngestionService } from '../memory-ingestion/memory-ingestion.ser
 import { GeminiService } from '../../infrastructure/gemini/gemini.service';
 import { Memory } from '../../types/memory.types';
 
+const textDecoder = new TextDecoder();
+
 @Injectable()
 export class MemoryQueryService {
   private readonly logger = new Logger(MemoryQueryService.name);
@@ -33,27 +35,30 @@ export class MemoryQueryService {
     try {
       // Get all memory records for this user
       const memoryRecords = await this.suiService.getUserMemories(userAddress);
-      const memories: Memory[] = [];
+      // Records carry no creation time, so format one timestamp for the whole batch
+      const now = new Date().toISOString();
 
-      // Populate memories with data
-      for (const record of memoryRecords) {
+      // Populate memories with data, fetching content for all records concurrently
+      const populated = await Promise.all(memoryRecords.map(async (record): Promise<Memory | null> => {
         try {
           // Get content from Walrus with caching
           const content = await this.cachedWalrusService.retrieveContent(record.blobId);
           
-          memories.push({
+          return {
             id: record.id,
             content: content, // Unencrypted content
             category: record.category,
-            timestamp: new Date().toISOString(), // Use creation time from record if available
+            timestamp: now, // Use creation time from record if available
             isEncrypted: false,
             owner: userAddress,
             walrusHash: record.blobId
-          });
+          };
         } catch (error) {
           this.logger.error(`Error retrieving memory ${record.id}: ${error.message}`);
+          return null;
         }
-      }
+      }));
+      const memories = populated.filter((memory): memory is Memory => memory !== null);
 
       return { 
         memories,
@@ -90,15 +95,15 @@ export class MemoryQueryService {
         return [];
       }
       
-      // Step 2: Create embedding for query
-      const { vector } = await this.embeddingService.embedText(query);
+      // Steps 2-4: Embed the query while the index and graph load, as none depends on another
+      const [{ vector }, { index }, graph] = await Promise.all([
+        this.embeddingService.embedText(query),
+        this.hnswIndexService.loadIndex(indexBlobId, userAddress),
+        this.graphService.loadGraph(graphBlobId, userAddress)
+      ]);
       
-      // Step 3: Load index and perform vector search
-      const { index } = await this.hnswIndexService.loadIndex(indexBlobId, userAddress);
+      // Vector search, then find related entities in the graph
       const searchResults = this.hnswIndexService.searchIndex(index, vector, limit * 2); // Get more results than needed
-      
-      // Step 4: Load graph and find related entities
-      const graph = await this.graphService.loadGraph(graphBlobId, userAddress);
       const entityToVectorMap = this.memoryIngestionService.getEntityToVectorMap(userAddress);
       
       // Step 5: Expand search using graph traversal
@@ -114,31 +119,32 @@ export class MemoryQueryService {
       const allVectorIds = [...new Set([...searchResults.ids, ...expandedVectorIds])];
       
       // Step 6: Get actual memory content for the vector IDs
-      const memories: string[] = [];
+      const vectorIds = allVectorIds.slice(0, limit);
+      const memoriesByVectorId = await this.suiService.getMemoriesWithVectorIds(userAddress, vectorIds);
+      const blobIds: string[] = [];
       const seenBlobIds = new Set<string>();
       
-      // Get all memory objects for this user
-      for (const vectorId of allVectorIds.slice(0, limit)) {
-        try {
-          const memoryObjects = await this.suiService.getMemoriesWithVectorId(userAddress, vectorId);
+      for (const vectorId of vectorIds) {
+        for (const memory of memoriesByVectorId.get(vectorId) || []) {
+          if (seenBlobIds.has(memory.blobId)) continue;
+          seenBlobIds.add(memory.blobId);
+          blobIds.push(memory.blobId);
           
-          for (const memory of memoryObjects) {
-            if (seenBlobIds.has(memory.blobId)) continue;
-            seenBlobIds.add(memory.blobId);
-            
-            // Get content from Walrus with caching
-            const content = await this.cachedWalrusService.retrieveContent(memory.blobId);
-            
-            memories.push(content);
-            
-            if (memories.length >= limit) break;
-          }
-        } catch (error) {
-          this.logger.error(`Error retrieving memory for vector ID ${vectorId}: ${error.message}`);
-          continue;
+          if (blobIds.length >= limit) break;
         }
       }
       
+      // Get content from Walrus with caching, all blobs concurrently
+      const contents = await Promise.all(blobIds.map(async (blobId) => {
+        try {
+          return await this.cachedWalrusService.retrieveContent(blobId);
+        } catch (error) {
+          this.logger.error(`Error retrieving memory content for blob ${blobId}: ${error.message}`);
+          return null;
+        }
+      }));
+      const memories = contents.filter((content): content is string => content !== null);
+      
       return memories;
     } catch (error) {
       this.logger.error(`Error finding relevant memories: ${error.message}`);
@@ -156,59 +162,60 @@ export class MemoryQueryService {
     k: number = 5
   ): Promise<{ results: Memory[] }> {
     try {
-      // Step 1: Create embedding for query
-      const { vector } = await this.embeddingService.embedText(query);
+      // Steps 1-2: Create embedding for query while looking up the user's memory index
+      const [{ vector }, memoryIndex] = await Promise.all([
+        this.embeddingService.embedText(query),
+        this.suiService.getMemoryIndex(userAddress).catch(() => null)
+      ]);
 
-      // Step 2: Get memory index for user
-      let indexBlobId: string;
-      
-      try {
-        const memoryIndex = await this.suiService.getMemoryIndex(userAddress);
-        indexBlobId = memoryIndex.indexBlobId;
-      } catch (error) {
+      if (!memoryIndex) {
         this.logger.log(`No memory index found for user ${userAddress}`);
         return { results: [] };
       }
+      const indexBlobId = memoryIndex.indexBlobId;
       
       // Step 3: Load index and perform vector search
       const { index } = await this.hnswIndexService.loadIndex(indexBlobId, userAddress);
       const searchResults = this.hnswIndexService.searchIndex(index, vector, k * 2);
       
-      // Step 4: Get memory content and filter by category if needed
-      const results: Memory[] = [];
+      // Step 4: Get memory objects for all hits at once and filter by category if needed
+      const memoriesByVectorId = await this.suiService.getMemoriesWithVectorIds(userAddress, searchResults.ids);
+      const matches: { memoryObj: { id: string; category: string; blobId: string }; distance: number }[] = [];
       
-      for (const vectorId of searchResults.ids) {
-        try {
-          const memoryObjects = await this.suiService.getMemoriesWithVectorId(userAddress, vectorId);
+      for (let i = 0; i < searchResults.ids.length && matches.length < k; i++) {
+        for (const memoryObj of memoriesByVectorId.get(searchResults.ids[i]) || []) {
+          // Skip if category filter is applied and doesn't match
+          if (category && memoryObj.category !== category) continue;
           
-          for (const memoryObj of memoryObjects) {
-            // Skip if category filter is applied and doesn't match
-            if (category && memoryObj.category !== category) continue;
-            
-            // Get content from Walrus with caching
-            const content = await this.cachedWalrusService.retrieveContent(memoryObj.blobId);
-            
-            // Add to results
-            results.push({
-              id: memoryObj.id,
-              content: content,
-              category: memoryObj.category,
-              timestamp: new Date().toISOString(),
-              isEncrypted: false,
-              owner: userAddress,
-              similarity_score: searchResults.distances[searchResults.ids.indexOf(vectorId)],
-              walrusHash: memoryObj.blobId
-            });
-            
-            if (results.length >= k) break;
-          }
+          matches.push({ memoryObj, distance: searchResults.distances[i] });
           
-          if (results.length >= k) break;
-        } catch (error) {
-          this.logger.error(`Error retrieving memory for vector ID ${vectorId}: ${error.message}`);
+          if (matches.length >= k) break;
         }
       }
       
+      // Get content from Walrus with caching, all matches concurrently
+      const now = new Date().toISOString();
+      const populated = await Promise.all(matches.map(async ({ memoryObj, distance }): Promise<Memory | null> => {
+        try {
+          const content = await this.cachedWalrusService.retrieveContent(memoryObj.blobId);
+          
+          return {
+            id: memoryObj.id,
+            content: content,
+            category: memoryObj.category,
+            timestamp: now,
+            isEncrypted: false,
+            owner: userAddress,
+            similarity_score: distance,
+            walrusHash: memoryObj.blobId
+          };
+        } catch (error) {
+          this.logger.error(`Error retrieving memory ${memoryObj.id}: ${error.message}`);
+          return null;
+        }
+      }));
+      const results = populated.filter((memory): memory is Memory => memory !== null);
+      
       return { results };
     } catch (error) {
       this.logger.error(`Error searching memories: ${error.message}`);
@@ -276,11 +283,12 @@ export class MemoryQueryService {
       const relevantMemoriesContent = await this.findRelevantMemories(queryText, userAddress, userSignature, k);
       
       // Format memories as structured objects
+      const now = new Date().toISOString();
       const relevantMemories: Memory[] = relevantMemoriesContent.map((content, index) => ({
         id: `mem-${index}`, // Placeholder ID
         content,
         category: 'auto', // We don't have actual category here
-        timestamp: new Date().toISOString(),
+        timestamp: now,
         isEncrypted: false, // Already decrypted
         owner: userAddress
       }));
@@ -340,7 +348,7 @@ export class MemoryQueryService {
     identityId: string
   ): Promise<{ content: string; success: boolean; error?: string }> {
     try {
-      const encryptedBytes = new Uint8Array(Buffer.from(encryptedContent, 'base64'));
+      const encryptedBytes = Buffer.from(encryptedContent, 'base64');
 
       // Determine access type from identity ID
       let moveCallConstructor;
@@ -348,7 +356,7 @@ export class MemoryQueryService {
       if (identityId.startsWith('timelock_')) {
         // Time-lock access
         const decryptedBytes = await this.sealService.decryptTimelock(encryptedBytes, userAddress);
-        const content = new TextDecoder().decode(decryptedBytes);
+        const content = textDecoder.decode(decryptedBytes);
         return { content, success: true };
       } else if (identityId.startsWith('allowlist_')) {
         // Allowlist access - would need to get allowlist details
@@ -362,7 +370,7 @@ export class MemoryQueryService {
       }
 
       const decryptedBytes = await this.sealService.decrypt(encryptedBytes, moveCallConstructor);
-      const content = new TextDecoder().decode(decryptedBytes);
+      const content = textDecoder.decode(decryptedBytes);
 
       return { content, success: true };
     } catch (error) {
@@ -464,34 +472,22 @@ export class MemoryQueryService {
   async getMemoryStats(userAddress: string): Promise<{
     total_memories: number,
     categories: Record<string, number>,
-    storage_used_bytes: number,
     last_updated: string,
     success: boolean
   }> {
     try {
-      // 1. Get all memories for user
-      const { memories } = await this.getUserMemories(userAddress);
+      // 1. List the user's memory records; no Walrus content is needed for counts
+      const memoryRecords = await this.suiService.getUserMemories(userAddress);
       
-      // 2. Calculate statistics
+      // 2. Count by category
       const categories: Record<string, number> = {};
-      let totalSize = 0;
-      
-      for (const memory of memories) {
-        // Count by category
-        if (categories[memory.category]) {
-          categories[memory.category] += 1;
-        } else {
-          categories[memory.category] = 1;
-        }
-        
-        // Sum up content sizes
-        totalSize += memory.content.length;
+      for (const record of memoryRecords) {
+        categories[record.category] = (categories[record.category] || 0) + 1;
       }
       
       return {
-        total_memories: memories.length,
+        total_memories: memoryRecords.length,
         categories,
-        storage_used_bytes: totalSize,
         last_updated: new Date().toISOString(),
         success: true
       };
@@ -500,7 +496,6 @@ export class MemoryQueryService {
       return {
         total_memories: 0,
         categories: {},
-        storage_used_bytes: 0,
         last_updated: new Date().toISOString(),
         success: false
       };
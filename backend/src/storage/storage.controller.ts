@@ -1,10 +1,12 @@
-import { Controller, Get, Param, HttpException, HttpStatus } from '@nestjs/common';
+import { Controller, Get, Param, HttpException, HttpStatus, Logger } from '@nestjs/common';
 import { StorageService } from '../infrastructure/storage/storage.service';
 import { LocalStorageService } from '../infrastructure/local-storage/local-storage.service';
 import { WalrusService } from '../infrastructure/walrus/walrus.service';
 
 @Controller('storage')
 export class StorageController {
+  private readonly logger = new Logger(StorageController.name);
+
   constructor(
     private readonly storageService: StorageService,
     private readonly localStorageService: LocalStorageService,
@@ -17,21 +19,21 @@ export class StorageController {
   @Get('retrieve/:blobId')
   async retrieveContent(@Param('blobId') blobId: string): Promise<{ content: string; success: boolean }> {
     try {
-      console.log(`Retrieving content for blob: ${blobId}`);
+      this.logger.debug(`Retrieving content for blob: ${blobId}`);
 
       // Check if it's a local storage blob ID
       if (blobId.startsWith('local_') || blobId.startsWith('demo_')) {
-        console.log(`Fetching from local storage: ${blobId}`);
+        this.logger.debug(`Fetching from local storage: ${blobId}`);
         const content = await this.localStorageService.retrieveContent(blobId);
         return { content, success: true };
       } else {
         // It's a Walrus blob ID
-        console.log(`Fetching from Walrus: ${blobId}`);
+        this.logger.debug(`Fetching from Walrus: ${blobId}`);
         const buffer = await this.walrusService.downloadFile(blobId);
         return { content: buffer.toString('utf-8'), success: true };
       }
     } catch (error) {
-      console.error(`Error retrieving content for blob ${blobId}:`, error);
+      this.logger.error(`Error retrieving content for blob ${blobId}: ${error.message}`);
       return { content: '', success: false };
     }
   }
@@ -58,7 +60,7 @@ export class StorageController {
       
       return { exists };
     } catch (error) {
-      console.error(`Error checking existence for blob ${blobId}:`, error);
+      this.logger.error(`Error checking existence for blob ${blobId}: ${error.message}`);
       return { exists: false };
     }
   }
@@ -72,7 +74,7 @@ export class StorageController {
       const stats = await this.storageService.getStats();
       return stats;
     } catch (error) {
-      console.error('Error getting storage stats:', error);
+      this.logger.error(`Error getting storage stats: ${error.message}`);
       throw new HttpException(
         'Failed to get storage statistics',
         HttpStatus.INTERNAL_SERVER_ERROR
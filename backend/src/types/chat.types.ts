@@ -21,6 +21,9 @@ export interface ChatSession {
   metadata?: Record<string, any>;
 }
 
+// Session metadata returned by session lists; messages are only loaded per session
+export type ChatSessionListItem = Omit<ChatSession, 'messages'>;
+
 export interface ChatMessageResponse {
   content: string;
   type: string;